@@ -23,6 +23,7 @@ from app.models import (
     Pharmacy,
     AccessToken,
     Client,
+    PharmacyClientCounter,
     Transaction,
     Invoice,
     AuditLog,
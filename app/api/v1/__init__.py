@@ -1,17 +1,23 @@
 """
 API v1 routes.
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from app.api.v1 import clients, transactions, payments, health
+from app.middleware.auth_middleware import verify_bearer
 
 # Create main v1 router
 api_router = APIRouter(prefix="/api/v1")
 
+# Routers whose every endpoint requires a valid Bearer token
+authenticated = [Depends(verify_bearer)]
+
 # Include sub-routers
 api_router.include_router(health.router, tags=["Health"])
-api_router.include_router(clients.router, prefix="/clients", tags=["Clients"])
-api_router.include_router(transactions.router, prefix="/transactions", tags=["Transactions"])
+api_router.include_router(clients.router, prefix="/clients", tags=["Clients"], dependencies=authenticated)
+api_router.include_router(transactions.router, prefix="/transactions", tags=["Transactions"], dependencies=authenticated)
+# Payments mixes authenticated endpoints with the public Mercado Pago webhook,
+# so its endpoints declare authentication individually
 api_router.include_router(payments.router, prefix="/payments", tags=["Payments"])
 
 __all__ = ["api_router"]
@@ -7,6 +7,7 @@ from sqlalchemy import text
 
 from app.db.session import get_db
 from app.core.config import settings
+from app.infrastructure.external.resilience import CircuitBreaker, circuit_breaker_states
 
 router = APIRouter()
 
@@ -16,7 +17,8 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     """
     Health check endpoint.
 
-    Returns service status and database connectivity.
+    Returns service status, database connectivity and the circuit breaker
+    state of external integrations.
     """
     # Check database connectivity
     try:
@@ -25,10 +27,16 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     except Exception as e:
         db_status = f"unhealthy: {str(e)}"
 
+    integrations = circuit_breaker_states()
+    integrations_healthy = all(
+        breaker["state"] != CircuitBreaker.OPEN for breaker in integrations.values()
+    )
+
     return {
-        "status": "healthy" if db_status == "healthy" else "degraded",
+        "status": "healthy" if db_status == "healthy" and integrations_healthy else "degraded",
         "service": settings.APP_NAME,
         "version": "0.1.0",
         "environment": settings.ENVIRONMENT,
         "database": db_status,
+        "integrations": integrations,
     }
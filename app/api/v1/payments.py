@@ -118,20 +118,20 @@ async def mercadopago_webhook(
                     mp_status = payment_info.get("status")
                     new_status = status_mapping.get(mp_status if mp_status else "", "pending")
 
-                    # Find pharmacy_id from transaction
+                    # Find pharmacy_id from transaction (only the column: the
+                    # scoped update below loads the transaction itself)
                     from sqlalchemy import select
                     from app.models.transaction import Transaction
 
-                    result = await db.execute(
-                        select(Transaction).where(Transaction.id == transaction_id)
+                    transaction_pharmacy_id = await db.scalar(
+                        select(Transaction.pharmacy_id).where(Transaction.id == transaction_id)
                     )
-                    transaction = result.scalar_one_or_none()
 
-                    if transaction:
+                    if transaction_pharmacy_id:
                         await TransactionService.update_payment_status(
                             db,
                             transaction_id,
-                            transaction.pharmacy_id,
+                            transaction_pharmacy_id,
                             payment_status=new_status,
                             mercadopago_payment_id=payment_id
                         )
@@ -3,6 +3,7 @@ from .client_dto import (
     CreateClientDTO,
     UpdateClientDTO,
     ClientResponseDTO,
+    ClientSummaryDTO,
     ClientListDTO,
 )
 from .transaction_dto import (
@@ -18,6 +19,7 @@ __all__ = [
     "CreateClientDTO",
     "UpdateClientDTO",
     "ClientResponseDTO",
+    "ClientSummaryDTO",
     "ClientListDTO",
     # Transaction DTOs
     "TransactionItemDTO",
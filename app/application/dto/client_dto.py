@@ -124,6 +124,39 @@ class ClientResponseDTO:
         )
 
 
+@dataclass
+class ClientSummaryDTO:
+    """DTO for compact client response (phone, status and balance)."""
+
+    id: UUID
+    phone: str
+    status: str
+    credit_limit: Decimal
+    current_balance: Decimal
+    available_credit: Decimal
+
+    @classmethod
+    def from_summary(cls, summary) -> "ClientSummaryDTO":
+        """
+        Create DTO from ClientSummary read model.
+
+        Args:
+            summary: ClientSummary read model
+
+        Returns:
+            ClientSummaryDTO
+        """
+        balance = summary.balance
+        return cls(
+            id=summary.id,
+            phone=str(summary.phone),
+            status=summary.status,
+            credit_limit=balance.credit_limit.amount,
+            current_balance=balance.current_balance.amount,
+            available_credit=balance.available_credit.amount,
+        )
+
+
 @dataclass
 class ClientListDTO:
     """DTO for paginated list of clients."""
@@ -1,12 +1,14 @@
 """Application use cases."""
 from .create_client import CreateClientUseCase
 from .get_client import GetClientUseCase
+from .get_client_summary import GetClientSummaryUseCase
 from .create_transaction import CreateTransactionUseCase
 from .process_payment import ProcessPaymentUseCase
 
 __all__ = [
     "CreateClientUseCase",
     "GetClientUseCase",
+    "GetClientSummaryUseCase",
     "CreateTransactionUseCase",
     "ProcessPaymentUseCase",
 ]
@@ -0,0 +1,48 @@
+"""Get client summary use case."""
+from uuid import UUID
+
+from app.application.interfaces import IQueryUseCase
+from app.application.dto import ClientSummaryDTO
+from app.domain.interfaces.repositories import IClientRepository
+from app.domain.exceptions import EntityNotFoundError
+
+
+class GetClientSummaryUseCase(IQueryUseCase[UUID, ClientSummaryDTO]):
+    """
+    Use case for retrieving a client's phone, status and balance by ID.
+
+    Query-side operation following CQRS pattern. Only the summary columns
+    are read, so callers that do not need the full client avoid loading it.
+    """
+
+    def __init__(self, client_repository: IClientRepository):
+        """
+        Initialize the use case.
+
+        Args:
+            client_repository: Client repository implementation
+        """
+        self._client_repository = client_repository
+
+    async def execute(self, query: UUID) -> ClientSummaryDTO:
+        """
+        Execute the get client summary query.
+
+        Args:
+            query: Client ID to retrieve
+
+        Returns:
+            Client summary DTO
+
+        Raises:
+            EntityNotFoundError: If client doesn't exist
+        """
+        summary = await self._client_repository.find_summary_by_id(query)
+
+        if not summary:
+            raise EntityNotFoundError(
+                entity_type="Client",
+                entity_id=str(query)
+            )
+
+        return ClientSummaryDTO.from_summary(summary)
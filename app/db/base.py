@@ -4,7 +4,11 @@ SQLAlchemy Base configuration for all models.
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 from sqlalchemy import MetaData
 from typing import Any
+from uuid import UUID
+import os
 import re
+import threading
+import time
 
 
 def camel_to_snake(name: str) -> str:
@@ -13,6 +17,50 @@ def camel_to_snake(name: str) -> str:
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
 
 
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, the next 12 (rand_a)
+    a counter and the last 62 random. The counter starts at a random value
+    below 2048 each millisecond and is incremented for every further ID in
+    the same millisecond (RFC 9562, section 6.2, method 1), so IDs generated
+    later by this process sort later, and primary key inserts land on the
+    rightmost B-tree pages instead of random ones. On counter overflow, or if
+    the clock goes backwards, the timestamp is advanced past the last one used.
+    """
+    global _uuid7_last_ms, _uuid7_counter
+
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_ms:
+            _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            timestamp_ms = _uuid7_last_ms
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                timestamp_ms += 1
+                _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        _uuid7_last_ms = timestamp_ms
+        counter = _uuid7_counter
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    # Version (0111) and variant (10) bits
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0x2 << 62
+        | random_bits
+    )
+    return UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """
     Base class for all SQLAlchemy models.
@@ -3,9 +3,24 @@ Database session management.
 """
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.pool import NullPool
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+import orjson
 from app.core.config import settings
 
+# asyncpg prepares every statement; caching them per connection lets repeated
+# queries (same SQL text from SQLAlchemy's statement cache) skip parse/plan
+connect_args = (
+    {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DATABASE_URL.startswith("postgresql+asyncpg")
+    else {}
+)
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson (non-string keys are stringified, as json.dumps does)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -15,6 +30,9 @@ engine = create_async_engine(
     pool_size=10,  # Number of connections to maintain
     max_overflow=20,  # Max additional connections during high load
     poolclass=NullPool if settings.ENVIRONMENT == "test" else None,
+    connect_args=connect_args,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
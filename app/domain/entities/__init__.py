@@ -1,12 +1,13 @@
 """Domain entities."""
 from .base import BaseEntity
-from .client import Client
+from .client import Client, ClientSummary
 from .pharmacy import Pharmacy
 from .transaction import Transaction, TransactionItem
 
 __all__ = [
     "BaseEntity",
     "Client",
+    "ClientSummary",
     "Pharmacy",
     "Transaction",
     "TransactionItem",
@@ -268,3 +268,24 @@ class Client(BaseEntity):
     def __repr__(self) -> str:
         """String representation."""
         return f"<Client(id={self.id}, phone={self.phone}, name='{self.display_name}', status='{self.status}')>"
+
+
+@dataclass(frozen=True, slots=True)
+class ClientSummary:
+    """
+    Read-only projection of a client for compact lookups.
+
+    Holds only identification, status and balance, so it is loaded without
+    the client's personal data, tags or metadata.
+
+    Attributes:
+        id: Client ID
+        phone: Client phone number
+        status: Client status (active, inactive, blocked)
+        balance: Financial balance and credit limit
+    """
+
+    id: UUID
+    phone: Phone
+    status: str
+    balance: ClientBalance
@@ -172,7 +172,7 @@ class Transaction(BaseEntity):
         """
         if not self.amount:
             # Calculate from items
-            items_total = sum((item.total for item in self.items), Money.zero(self.total_amount.currency))
+            items_total = Money.sum((item.total for item in self.items), self.total_amount.currency)
             base = items_total
         else:
             base = self.amount
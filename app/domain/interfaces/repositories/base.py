@@ -22,6 +22,9 @@ class IRepository(ABC, Generic[EntityT, CreateSchemaT, UpdateSchemaT]):
         UpdateSchemaT: The schema for updating existing entities
     """
 
+    # Interfaces hold no state, so implementations may use __slots__
+    __slots__ = ()
+
     @abstractmethod
     async def create(self, data: CreateSchemaT) -> EntityT:
         """
@@ -1,9 +1,11 @@
 """Client repository interface."""
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from decimal import Decimal
 from uuid import UUID
 
 from .base import IRepository
-from app.domain.entities import Client
+from app.domain.entities import Client, ClientSummary
 from app.domain.value_objects import Phone
 
 
@@ -14,6 +16,8 @@ class IClientRepository(IRepository[Client, Client, Client]):
     Extends the base repository with client-specific query methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def find_by_phone(
         self,
@@ -32,6 +36,37 @@ class IClientRepository(IRepository[Client, Client, Client]):
         """
         pass
 
+    @abstractmethod
+    async def find_summary_by_id(self, entity_id: UUID) -> ClientSummary | None:
+        """
+        Find a client's summary (phone, status and balance) by ID.
+
+        Args:
+            entity_id: Client ID
+
+        Returns:
+            ClientSummary if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def find_summary_by_phone(
+        self,
+        phone: Phone,
+        pharmacy_id: UUID
+    ) -> ClientSummary | None:
+        """
+        Find a client's summary (phone, status and balance) by phone number within a pharmacy.
+
+        Args:
+            phone: Client phone number
+            pharmacy_id: Pharmacy ID for multi-tenant isolation
+
+        Returns:
+            ClientSummary if found, None otherwise
+        """
+        pass
+
     @abstractmethod
     async def find_by_pharmacy(
         self,
@@ -137,12 +172,53 @@ class IClientRepository(IRepository[Client, Client, Client]):
         pass
 
     @abstractmethod
-    async def count_by_pharmacy(self, pharmacy_id: UUID) -> int:
+    def iter_by_pharmacy(
+        self,
+        pharmacy_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[Client]:
+        """
+        Stream all clients for a pharmacy.
+
+        Rows are fetched in batches, so memory stays flat for exports.
+
+        Args:
+            pharmacy_id: Pharmacy ID
+            batch_size: Number of rows fetched per round-trip
+
+        Returns:
+            Async iterator of clients
+        """
+        pass
+
+    @abstractmethod
+    def search_iter(
+        self,
+        query: str,
+        pharmacy_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[Client]:
+        """
+        Stream all clients matching a search by name, phone, or email.
+
+        Args:
+            query: Search query
+            pharmacy_id: Pharmacy ID
+            batch_size: Number of rows fetched per round-trip
+
+        Returns:
+            Async iterator of matching clients
+        """
+        pass
+
+    @abstractmethod
+    async def count_by_pharmacy(self, pharmacy_id: UUID, approx: bool = False) -> int:
         """
         Count clients for a pharmacy.
 
         Args:
             pharmacy_id: Pharmacy ID
+            approx: Return a fast estimate instead of an exact count, where supported
 
         Returns:
             Number of clients
@@ -161,3 +237,26 @@ class IClientRepository(IRepository[Client, Client, Client]):
             Next sequential ID
         """
         pass
+
+    @abstractmethod
+    async def bulk_create(self, clients: list[Client]) -> list[Client]:
+        """
+        Create many clients in a single transaction.
+
+        Args:
+            clients: Clients to persist
+
+        Returns:
+            The persisted clients
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update_balances(self, updates: list[tuple[UUID, Decimal]]) -> None:
+        """
+        Set the current balance of many clients in a single transaction.
+
+        Args:
+            updates: (client ID, new current balance) pairs
+        """
+        pass
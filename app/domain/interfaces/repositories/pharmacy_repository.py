@@ -13,6 +13,8 @@ class IPharmacyRepository(IRepository[Pharmacy, dict, dict]):
     Extends the base repository with pharmacy-specific query methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def find_by_tax_id(self, tax_id: TaxId) -> Pharmacy | None:
         """
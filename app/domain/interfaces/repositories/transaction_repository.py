@@ -15,6 +15,8 @@ class ITransactionRepository(IRepository[Transaction, Transaction, Transaction])
     Extends the base repository with transaction-specific query methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     async def find_by_transaction_number(
         self,
@@ -1,5 +1,6 @@
 """Transaction number generation domain service."""
 from datetime import date
+from typing import Final
 
 from app.domain.interfaces.services import IDomainService
 
@@ -70,8 +71,9 @@ class TransactionNumberGenerator(IDomainService):
 
         prefix, date_str, sequence_str = parts
 
-        # Validate prefix
-        if prefix not in self.PREFIX_MAP.values():
+        # Validate prefix (a missing reverse mapping means an unknown prefix)
+        transaction_type = _REVERSE_PREFIX_MAP.get(prefix)
+        if transaction_type is None:
             raise ValueError(f"Invalid prefix: {prefix}")
 
         # Parse date
@@ -90,15 +92,16 @@ class TransactionNumberGenerator(IDomainService):
         except ValueError:
             raise ValueError(f"Invalid sequence: {sequence_str}")
 
-        # Get transaction type
-        transaction_type = next(
-            (k for k, v in self.PREFIX_MAP.items() if v == prefix),
-            None
-        )
-
         return {
             "transaction_type": transaction_type,
             "date": transaction_date,
             "sequence": sequence,
             "prefix": prefix,
         }
+
+
+# Prefix -> transaction type, built once for O(1) lookups in parse()
+_REVERSE_PREFIX_MAP: Final[dict[str, str]] = {
+    prefix: transaction_type
+    for transaction_type, prefix in TransactionNumberGenerator.PREFIX_MAP.items()
+}
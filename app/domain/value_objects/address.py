@@ -1,5 +1,12 @@
 """Address value object."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+# Bit masks for the populated-fields state
+_STREET = 1 << 0
+_CITY = 1 << 1
+_STATE = 1 << 2
+_POSTAL_CODE = 1 << 3
+_ALL_FIELDS = _STREET | _CITY | _STATE | _POSTAL_CODE
 
 
 @dataclass(frozen=True)
@@ -22,12 +29,22 @@ class Address:
     state: str | None = None
     postal_code: str | None = None
     country: str = "AR"
+    _state: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate address after initialization."""
         if self.country and len(self.country) != 2:
             raise ValueError(f"Invalid country code: {self.country}")
 
+        # Precompute which fields are set (immutable, so computed once)
+        state = (
+            (_STREET if self.street else 0)
+            | (_CITY if self.city else 0)
+            | (_STATE if self.state else 0)
+            | (_POSTAL_CODE if self.postal_code else 0)
+        )
+        object.__setattr__(self, "_state", state)
+
     @classmethod
     def create(
         cls,
@@ -65,11 +82,11 @@ class Address:
 
     def is_complete(self) -> bool:
         """Check if address has all required fields."""
-        return all([self.street, self.city, self.state, self.postal_code])
+        return self._state == _ALL_FIELDS
 
     def is_empty(self) -> bool:
         """Check if address is empty."""
-        return not any([self.street, self.city, self.state, self.postal_code])
+        return self._state == 0
 
     def formatted(self, single_line: bool = False) -> str:
         """
@@ -108,4 +125,4 @@ class Address:
 
     def __bool__(self) -> bool:
         """Boolean evaluation."""
-        return not self.is_empty()
+        return self._state != 0
@@ -52,6 +52,26 @@ class ClientBalance:
 
         return cls(current_balance=current_balance, credit_limit=credit_limit)
 
+    @classmethod
+    def from_trusted(cls, current_balance: Money, credit_limit: Money) -> "ClientBalance":
+        """
+        Create a ClientBalance from stored values that are known to be valid.
+
+        Skips validation; use only for values that were validated when
+        stored (e.g. loaded from the database).
+
+        Args:
+            current_balance: Current balance
+            credit_limit: Credit limit
+
+        Returns:
+            ClientBalance value object
+        """
+        balance = object.__new__(cls)
+        object.__setattr__(balance, "current_balance", current_balance)
+        object.__setattr__(balance, "credit_limit", credit_limit)
+        return balance
+
     @classmethod
     def zero(cls, currency: str = "ARS") -> "ClientBalance":
         """Create a zero balance."""
@@ -129,16 +149,16 @@ class ClientBalance:
         if amount.currency != self.current_balance.currency:
             raise ValueError(f"Currency mismatch: {amount.currency} != {self.current_balance.currency}")
 
-        # Calculate balance after purchase
-        projected_balance = self.current_balance - amount
+        # Calculate balance after purchase on the raw amounts (both already
+        # rounded to 2 places, so no intermediate Money objects are needed)
+        projected_amount = self.current_balance.amount - amount.amount
 
-        # If projected balance is positive or within credit limit
-        if projected_balance.is_positive() or projected_balance.is_zero():
+        # If projected balance is positive or zero
+        if projected_amount >= 0:
             return True
 
         # Check if debt would exceed credit limit
-        projected_debt = projected_balance.abs()
-        return projected_debt <= self.credit_limit
+        return -projected_amount <= self.credit_limit.amount
 
     def apply_charge(self, amount: Money) -> "ClientBalance":
         """
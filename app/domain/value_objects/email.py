@@ -42,6 +42,24 @@ class Email:
         """
         return cls(value=email.strip().lower())
 
+    @classmethod
+    def from_trusted(cls, email: str) -> "Email":
+        """
+        Create an Email from an address that is known to be valid.
+
+        Skips normalization and validation; use only for values that were
+        validated when stored (e.g. loaded from the database).
+
+        Args:
+            email: The email address
+
+        Returns:
+            Email value object
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", email)
+        return instance
+
     @property
     def domain(self) -> str:
         """Get the email domain."""
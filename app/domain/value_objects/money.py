@@ -1,6 +1,19 @@
 """Money value object for currency handling."""
 from dataclasses import dataclass
+from collections.abc import Iterable
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Final
+
+# Quantum for 2-decimal-place rounding
+_CENTS: Final[Decimal] = Decimal("0.01")
+
+# Display symbols for known currencies
+_SYMBOLS: Final[dict[str, str]] = {
+    "ARS": "$",
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+}
 
 
 @dataclass(frozen=True)
@@ -23,17 +36,20 @@ class Money:
 
     def __post_init__(self):
         """Validate money object after initialization."""
-        # Convert to Decimal if needed
-        if not isinstance(self.amount, Decimal):
-            object.__setattr__(self, "amount", Decimal(str(self.amount)))
-
         # Validate currency code
         if len(self.currency) != 3:
             raise ValueError(f"Invalid currency code: {self.currency}")
 
+        amount = self.amount
+        if isinstance(amount, Decimal):
+            # Decimals already at 2 places (e.g. loaded from the DB) need no rounding
+            if amount.as_tuple().exponent == -2:
+                return
+        else:
+            amount = Decimal(str(amount))
+
         # Round to 2 decimal places
-        rounded = self.amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        object.__setattr__(self, "amount", rounded)
+        object.__setattr__(self, "amount", amount.quantize(_CENTS, rounding=ROUND_HALF_UP))
 
     @classmethod
     def create(cls, amount: int | float | str | Decimal, currency: str = "ARS") -> "Money":
@@ -49,11 +65,57 @@ class Money:
         """
         return cls(amount=Decimal(str(amount)), currency=currency.upper())
 
+    @classmethod
+    def from_trusted(cls, amount: Decimal, currency: str = "ARS") -> "Money":
+        """
+        Create a Money value object from a stored, already rounded amount.
+
+        Skips validation and rounding; use only for values that were
+        validated when stored (e.g. a DECIMAL(12, 2) database column).
+
+        Args:
+            amount: The monetary amount, already at 2 decimal places
+            currency: The currency code (default: ARS)
+
+        Returns:
+            Money value object
+        """
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        object.__setattr__(money, "currency", currency)
+        return money
+
     @classmethod
     def zero(cls, currency: str = "ARS") -> "Money":
         """Create a zero money value."""
         return cls(amount=Decimal("0"), currency=currency)
 
+    @classmethod
+    def sum(cls, items: Iterable["Money"], currency: str = "ARS") -> "Money":
+        """
+        Sum many money values in a single pass.
+
+        Accumulates the raw Decimal amounts and builds one Money at the end,
+        instead of allocating an intermediate Money per addition.
+
+        Args:
+            items: Money values to sum
+            currency: Currency of the values (and of the zero result when empty)
+
+        Returns:
+            New Money with the total
+
+        Raises:
+            ValueError: If any item has a different currency
+        """
+        total = Decimal("0")
+        for item in items:
+            if item.currency != currency:
+                raise ValueError(f"Cannot add different currencies: {currency} and {item.currency}")
+            total += item.amount
+
+        return cls(amount=total, currency=currency)
+
     def add(self, other: "Money") -> "Money":
         """
         Add two money values.
@@ -250,15 +312,9 @@ class Money:
         Returns:
             Formatted money string
         """
-        symbols = {
-            "ARS": "$",
-            "USD": "$",
-            "EUR": "€",
-            "GBP": "£",
-        }
-
         amount_str = f"{self.amount:,.2f}"
 
-        if symbol and self.currency in symbols:
-            return f"{symbols[self.currency]} {amount_str}"
+        currency_symbol = _SYMBOLS.get(self.currency) if symbol else None
+        if currency_symbol:
+            return f"{currency_symbol} {amount_str}"
         return f"{self.currency} {amount_str}"
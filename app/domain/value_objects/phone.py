@@ -2,6 +2,9 @@
 import re
 from dataclasses import dataclass
 
+# Translation table that deletes the punctuation allowed in raw phone input
+_PHONE_PUNCTUATION = str.maketrans("", "", "-()")
+
 
 @dataclass(frozen=True)
 class Phone:
@@ -27,8 +30,11 @@ class Phone:
         if not self.normalized:
             raise ValueError("Normalized phone number cannot be empty")
 
-        # Validate format (basic validation)
-        if not re.match(r"^\+?[\d\s\-\(\)]+$", self.value):
+        # Validate format (basic validation): optional leading "+", then only
+        # digits and separators. split() drops any Unicode whitespace, like
+        # the regex \s, so numbers pasted with non-breaking spaces stay valid
+        digits = self.value[1:] if self.value.startswith("+") else self.value
+        if not "".join(digits.translate(_PHONE_PUNCTUATION).split()).isdecimal():
             raise ValueError(f"Invalid phone number format: {self.value}")
 
     @classmethod
@@ -83,6 +89,25 @@ class Phone:
         """
         return cls(value=normalized, normalized=normalized)
 
+    @classmethod
+    def from_trusted(cls, normalized: str) -> "Phone":
+        """
+        Create a Phone from a normalized number that is known to be valid.
+
+        Skips validation; use only for values that were validated when
+        stored (e.g. loaded from the database).
+
+        Args:
+            normalized: The normalized phone number
+
+        Returns:
+            Phone value object
+        """
+        phone = object.__new__(cls)
+        object.__setattr__(phone, "value", normalized)
+        object.__setattr__(phone, "normalized", normalized)
+        return phone
+
     @property
     def international_format(self) -> str:
         """Get phone number in international format (+54 9 11 1234 5678)."""
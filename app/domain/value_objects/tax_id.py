@@ -1,6 +1,8 @@
 """Tax ID value object for DNI/CUIT/CUIL."""
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+_NON_DIGIT = re.compile(r"\D")
 
 
 @dataclass(frozen=True)
@@ -17,24 +19,31 @@ class TaxId:
 
     value: str
     type: str
+    _numeric: str = field(default="", init=False, repr=False, compare=False)
+    _formatted: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate tax ID after initialization."""
         if not self.value:
             raise ValueError("Tax ID cannot be empty")
 
-        if self.type not in ["DNI", "CUIT", "CUIL"]:
+        if self.type not in ("DNI", "CUIT", "CUIL"):
             raise ValueError(f"Invalid tax ID type: {self.type}")
 
-        # Remove non-numeric characters for validation
-        numeric = re.sub(r"\D", "", self.value)
+        # Remove non-numeric characters once; validation and formatting reuse it
+        numeric = _NON_DIGIT.sub("", self.value)
 
         if self.type == "DNI":
             if not (7 <= len(numeric) <= 8):
                 raise ValueError(f"Invalid DNI length: {self.value}")
-        elif self.type in ["CUIT", "CUIL"]:
+            formatted = numeric
+        else:
             if len(numeric) != 11:
                 raise ValueError(f"Invalid {self.type} length: {self.value}")
+            formatted = f"{numeric[0:2]}-{numeric[2:10]}-{numeric[10]}"
+
+        object.__setattr__(self, "_numeric", numeric)
+        object.__setattr__(self, "_formatted", formatted)
 
     @classmethod
     def create(cls, value: str, type: str = "DNI") -> "TaxId":
@@ -52,7 +61,7 @@ class TaxId:
         cleaned = value.strip()
 
         # Auto-detect type if not specified
-        numeric = re.sub(r"\D", "", cleaned)
+        numeric = _NON_DIGIT.sub("", cleaned)
 
         if type == "DNI":
             # Keep as DNI
@@ -83,7 +92,7 @@ class TaxId:
     @property
     def numeric(self) -> str:
         """Get numeric-only representation."""
-        return re.sub(r"\D", "", self.value)
+        return self._numeric
 
     @property
     def formatted(self) -> str:
@@ -93,12 +102,7 @@ class TaxId:
         Returns:
             Formatted tax ID (XX-XXXXXXXX-X for CUIT/CUIL, XXXXXXXX for DNI)
         """
-        numeric = self.numeric
-
-        if self.type in ["CUIT", "CUIL"] and len(numeric) == 11:
-            return f"{numeric[0:2]}-{numeric[2:10]}-{numeric[10]}"
-
-        return numeric
+        return self._formatted
 
     @property
     def is_dni(self) -> bool:
@@ -123,8 +127,8 @@ class TaxId:
         """Compare by numeric value."""
         if not isinstance(other, TaxId):
             return False
-        return self.numeric == other.numeric
+        return self._numeric == other._numeric
 
     def __hash__(self) -> int:
         """Hash by numeric value."""
-        return hash(self.numeric)
+        return hash(self._numeric)
@@ -1,13 +1,26 @@
-"""Infrastructure configuration modules."""
-from .settings import Settings, get_settings, settings
-from .application import ApplicationConfig
-from .database import DatabaseConfig
-from .whatsapp import WhatsAppConfig
-from .payment import PaymentConfig
-from .ai import AIConfig
-from .security import SecurityConfig
-from .storage import StorageConfig
-from .plex import PlexConfig
+"""
+Infrastructure configuration modules.
+
+Names are resolved lazily (PEP 562): importing one configuration class only
+imports its own module, and the global `settings` instance is only built on
+first access. The `Settings` class lives in the `unified` submodule, so no
+submodule shadows the exported `settings` instance.
+"""
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "Settings": "unified",
+    "get_settings": "unified",
+    "ApplicationConfig": "application",
+    "DatabaseConfig": "database",
+    "WhatsAppConfig": "whatsapp",
+    "PaymentConfig": "payment",
+    "AIConfig": "ai",
+    "SecurityConfig": "security",
+    "StorageConfig": "storage",
+    "PlexConfig": "plex",
+}
 
 __all__ = [
     "Settings",
@@ -22,3 +35,22 @@ __all__ = [
     "StorageConfig",
     "PlexConfig",
 ]
+
+
+def __getattr__(name: str):
+    """Import configuration names on first access."""
+    if name == "settings":
+        return import_module(".unified", __name__).get_settings()
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily resolved names alongside loaded ones."""
+    return sorted(set(globals()) | set(__all__))
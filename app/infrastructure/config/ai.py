@@ -1,22 +1,18 @@
 """AI service configuration."""
+from functools import cached_property
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
 
-class AIConfig(BaseSettings):
+class AIConfig(BaseConfig):
     """
     AI/ML service configuration (OpenAI, LangChain, etc.).
 
     Optional configuration for AI-powered features like intelligent query responses.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="AI_"
-    )
+    model_config = SettingsConfigDict(env_prefix="AI_")
 
     # OpenAI Configuration
     openai_api_key: str | None = Field(
@@ -70,7 +66,7 @@ class AIConfig(BaseSettings):
         description="Cache time-to-live in hours"
     )
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
         """Check if AI service is properly configured."""
         return bool(self.openai_api_key)
@@ -1,22 +1,19 @@
 """Application-level configuration settings."""
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import sys
+from typing import Any
+from pydantic import Field, PrivateAttr
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
 
-class ApplicationConfig(BaseSettings):
+class ApplicationConfig(BaseConfig):
     """
     Core application configuration.
 
     Handles application-level settings like name, version, environment, and server configuration.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="APP_"
-    )
+    model_config = SettingsConfigDict(env_prefix="APP_")
 
     # Application Metadata
     name: str = Field(
@@ -104,20 +101,27 @@ class ApplicationConfig(BaseSettings):
         description="Enable health check endpoints"
     )
 
+    # Lower-cased, interned environment, normalized once after loading
+    _environment: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize values used by the environment checks."""
+        self._environment = sys.intern(self.environment.lower())
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment.lower() == "production"
+        return self._environment == "production"
 
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.environment.lower() == "development"
+        return self._environment == "development"
 
     @property
     def is_staging(self) -> bool:
         """Check if running in staging environment."""
-        return self.environment.lower() == "staging"
+        return self._environment == "staging"
 
     @property
     def server_url(self) -> str:
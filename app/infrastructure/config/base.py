@@ -0,0 +1,162 @@
+"""
+Shared base for configuration modules.
+
+All configuration classes read from the same `.env` file and process
+environment. Instead of letting every class re-open and re-parse `.env`
+through pydantic-settings, the environment is snapshotted once and shared
+by every config through a custom settings source.
+"""
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar
+
+from dotenv import dotenv_values
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+
+# Comma separator for list values given as CSV, absorbing surrounding whitespace
+CSV_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+@lru_cache()
+def load_environment(env_file: str | Path | None = ".env") -> dict[str, str]:
+    """
+    Get a cached snapshot of the `.env` file merged with the process environment.
+
+    The file is read and parsed only once per process. Process environment
+    variables take precedence over `.env` values, and keys are lower-cased
+    because all configuration modules are case-insensitive.
+
+    Args:
+        env_file: Path to the dotenv file (None to skip it)
+
+    Returns:
+        Mapping of lower-cased variable names to values
+    """
+    environment: dict[str, str] = {}
+
+    if env_file and os.path.isfile(env_file):
+        for key, value in dotenv_values(env_file, encoding="utf-8").items():
+            if value is not None:
+                environment[key.lower()] = value
+
+    for key, value in os.environ.items():
+        environment[key.lower()] = value
+
+    return environment
+
+
+@lru_cache()
+def load_config_environment(
+    settings_cls: type["BaseConfig"],
+    env_file: str | Path | None = ".env",
+) -> dict[str, str]:
+    """
+    Get the cached environment values that apply to a configuration class.
+
+    Each class's values are extracted from the shared snapshot once, so
+    later instantiations only iterate over the variables actually set.
+
+    Args:
+        settings_cls: Configuration class
+        env_file: Path to the dotenv file (None to skip it)
+
+    Returns:
+        Mapping of field names to raw (string) values
+    """
+    environment = load_environment(env_file)
+    return {
+        field_name: environment[env_name]
+        for field_name, (env_name, _) in settings_cls.env_names.items()
+        if env_name in environment
+    }
+
+
+def reset_environment() -> None:
+    """Discard cached environment snapshots so they are re-read on next use."""
+    load_config_environment.cache_clear()
+    load_environment.cache_clear()
+
+
+class EnvironmentSettingsSource(PydanticBaseSettingsSource):
+    """
+    Settings source backed by the shared environment snapshot.
+
+    Replaces pydantic-settings' env and dotenv sources. Resolution rules are
+    the same: a field with an alias is read from the alias, any other field
+    from `{env_prefix}{field_name}`.
+    """
+
+    def __init__(self, settings_cls: type["BaseConfig"]):
+        super().__init__(settings_cls)
+        self.env_names = settings_cls.env_names
+        self.values = load_config_environment(settings_cls, self.config.get("env_file"))
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        """Get the raw environment value for a field."""
+        _, key = self.env_names[field_name]
+        return self.values.get(field_name), key, self.field_is_complex(field)
+
+    def __call__(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        fields = self.settings_cls.model_fields
+
+        for field_name, value in self.values.items():
+            _, key = self.env_names[field_name]
+
+            if self.field_is_complex(fields[field_name]):
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    # Leave non-JSON values (e.g. comma-separated lists) to field validators
+                    pass
+
+            data[key] = value
+
+        return data
+
+
+class BaseConfig(BaseSettings):
+    """Base class for configuration modules sharing a single environment snapshot."""
+
+    # Shared by all configuration modules; subclasses only set `env_prefix`.
+    # Validators are built on first instantiation rather than at import, so
+    # config modules that are never used cost nothing at startup.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        defer_build=True,
+    )
+
+    # field name -> (lower-cased environment variable name, input key), built once per class
+    env_names: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the environment variable each field is read from."""
+        super().__pydantic_init_subclass__(**kwargs)
+        env_prefix = cls.model_config.get("env_prefix", "")
+        cls.env_names = {
+            field_name: (
+                (field.alias or f"{env_prefix}{field_name}").lower(),
+                field.alias or field_name,
+            )
+            for field_name, field in cls.model_fields.items()
+        }
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Replace the per-class env and dotenv sources with the shared snapshot."""
+        return (init_settings, EnvironmentSettingsSource(settings_cls), file_secret_settings)
@@ -1,22 +1,19 @@
 """Database configuration settings."""
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import sys
+from typing import Any
+from pydantic import Field, PrivateAttr
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
 
-class DatabaseConfig(BaseSettings):
+class DatabaseConfig(BaseConfig):
     """
     Database configuration for PostgreSQL, MongoDB, and Redis.
 
     Follows Single Responsibility Principle by handling only database-related settings.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="DB_"
-    )
+    model_config = SettingsConfigDict(env_prefix="DB_")
 
     # PostgreSQL Configuration
     url: str = Field(
@@ -54,12 +51,19 @@ class DatabaseConfig(BaseSettings):
     redis_max_connections: int = Field(default=50, description="Max Redis connections")
     redis_decode_responses: bool = Field(default=True, description="Decode Redis responses")
 
+    # Lower-cased, interned URL scheme (e.g. "postgresql+asyncpg"), parsed once after loading
+    _scheme: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Parse the database URL scheme used by the backend checks."""
+        self._scheme = sys.intern(self.url.split("://", 1)[0].lower())
+
     @property
     def is_sqlite(self) -> bool:
         """Check if using SQLite database."""
-        return self.url.startswith("sqlite")
+        return self._scheme.startswith("sqlite")
 
     @property
     def is_postgresql(self) -> bool:
         """Check if using PostgreSQL database."""
-        return "postgresql" in self.url
+        return self._scheme.startswith("postgresql")
@@ -1,9 +1,13 @@
 """Payment gateway configuration."""
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import sys
+from functools import cached_property
+from typing import Any
+from pydantic import Field, PrivateAttr
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
 
-class PaymentConfig(BaseSettings):
+class PaymentConfig(BaseConfig):
     """
     Payment gateway integration configuration.
 
@@ -11,13 +15,7 @@ class PaymentConfig(BaseSettings):
     (MercadoPago, Stripe, PayPal, etc.) through configuration, not code changes.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="PAYMENT_"
-    )
+    model_config = SettingsConfigDict(env_prefix="PAYMENT_")
 
     # Provider Configuration
     provider: str = Field(
@@ -75,23 +73,34 @@ class PaymentConfig(BaseSettings):
         description="Maximum payment amount in currency"
     )
 
-    @property
+    # Values derived once after loading
+    _provider: str = PrivateAttr(default="")
+    _amount_range: tuple[float, float] = PrivateAttr(default=(0.0, 0.0))
+
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize the provider and collect the payment amount limits."""
+        # Lower-cased and interned for the provider checks
+        self._provider = sys.intern(self.provider.lower())
+        self._amount_range = (self.min_payment_amount, self.max_payment_amount)
+
+    @cached_property
     def is_configured(self) -> bool:
         """Check if payment gateway is properly configured."""
-        if self.provider.lower() == "mercadopago":
+        if self._provider == "mercadopago":
             return bool(self.mercadopago_access_token and self.mercadopago_public_key)
         return False
 
     @property
     def is_mercadopago(self) -> bool:
         """Check if using MercadoPago provider."""
-        return self.provider.lower() == "mercadopago"
+        return self._provider == "mercadopago"
 
     @property
     def is_stripe(self) -> bool:
         """Check if using Stripe provider."""
-        return self.provider.lower() == "stripe"
+        return self._provider == "stripe"
 
     def validate_amount(self, amount: float) -> bool:
         """Validate if payment amount is within limits."""
-        return self.min_payment_amount <= amount <= self.max_payment_amount
+        low, high = self._amount_range
+        return low <= amount <= high
@@ -1,9 +1,11 @@
 """Plex (ERP) integration configuration."""
+from functools import cached_property
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
 
-class PlexConfig(BaseSettings):
+class PlexConfig(BaseConfig):
     """Configuration for Plex 25 HTTP API integration.
 
     The API uses Basic authentication and exposes GET/POST endpoints under the
@@ -11,13 +13,7 @@ class PlexConfig(BaseSettings):
     `PLEX_` to keep credentials isolated from other services.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="PLEX_",
-    )
+    model_config = SettingsConfigDict(env_prefix="PLEX_")
 
     base_url: str = Field(
         default="",
@@ -39,13 +35,13 @@ class PlexConfig(BaseSettings):
         description="Whether to verify SSL certificates when connecting",
     )
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
         """Return True when mandatory credentials are present."""
 
         return bool(self.base_url and self.username and self.password)
 
-    @property
+    @cached_property
     def sanitized_base_url(self) -> str:
         """Return the base URL without trailing slash for safe joins."""
 
@@ -1,27 +1,33 @@
 """Security and authentication configuration."""
 import secrets
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
+from .base import CSV_SEPARATOR, BaseConfig
 
 
-class SecurityConfig(BaseSettings):
+def _generate_secret_key() -> str:
+    """
+    Generate a random secret key for development use.
+
+    Only called when SECRET_KEY is not provided: pydantic invokes a field's
+    default_factory solely for missing values, so production deployments that
+    set SECRET_KEY never read from the system random source at startup.
+    """
+    return secrets.token_urlsafe(32)
+
+
+class SecurityConfig(BaseConfig):
     """
     Security, authentication, and authorization configuration.
 
     Handles JWT, CORS, rate limiting, and other security-related settings.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="SECURITY_"
-    )
+    model_config = SettingsConfigDict(env_prefix="SECURITY_")
 
     # JWT Configuration
     secret_key: str = Field(
-        default_factory=lambda: secrets.token_urlsafe(32),
+        default_factory=_generate_secret_key,
         description="Secret key for JWT signing",
         alias="SECRET_KEY"
     )
@@ -121,7 +127,8 @@ class SecurityConfig(BaseSettings):
     def parse_allowed_origins(cls, v):
         """Parse ALLOWED_ORIGINS from comma-separated string or list."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
+            v = v.strip()
+            return CSV_SEPARATOR.split(v) if v else []
         return v
 
     @field_validator("allowed_methods", mode="before")
@@ -129,7 +136,8 @@ class SecurityConfig(BaseSettings):
     def parse_allowed_methods(cls, v):
         """Parse ALLOWED_METHODS from comma-separated string or list."""
         if isinstance(v, str):
-            return [method.strip() for method in v.split(",")]
+            v = v.strip()
+            return CSV_SEPARATOR.split(v) if v else []
         return v
 
     @property
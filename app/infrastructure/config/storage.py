@@ -1,23 +1,24 @@
 """File storage configuration."""
+import os
+import sys
 from pathlib import Path
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Any
+from pydantic import Field, PrivateAttr, field_validator
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
+# Directories already ensured in this process, keyed by absolute path
+_ensured_directories: set[str] = set()
 
-class StorageConfig(BaseSettings):
+
+class StorageConfig(BaseConfig):
     """
     File storage configuration for documents, PDFs, and uploads.
 
     Handles file storage settings for invoices, receipts, and other documents.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="STORAGE_"
-    )
+    model_config = SettingsConfigDict(env_prefix="STORAGE_")
 
     # PDF Storage Configuration
     pdf_storage_path: str = Field(
@@ -40,8 +41,8 @@ class StorageConfig(BaseSettings):
         default=10485760,  # 10 MB
         description="Maximum upload size in bytes"
     )
-    allowed_extensions: list[str] = Field(
-        default=["pdf", "png", "jpg", "jpeg", "xlsx", "csv"],
+    allowed_extensions: frozenset[str] = Field(
+        default=frozenset({"pdf", "png", "jpg", "jpeg", "xlsx", "csv"}),
         description="Allowed file extensions for uploads"
     )
 
@@ -79,31 +80,55 @@ class StorageConfig(BaseSettings):
         description="Enable automatic cleanup of old files"
     )
 
+    # Values derived once after loading
+    _storage_type: str = PrivateAttr(default="")
+    _pdf_storage_dir: Path = PrivateAttr()
+    _upload_dir: Path = PrivateAttr()
+
+    @field_validator("allowed_extensions", mode="after")
+    @classmethod
+    def normalize_allowed_extensions(cls, v: frozenset[str]) -> frozenset[str]:
+        """Lower-case allowed extensions once so lookups need no normalization."""
+        return frozenset(extension.lower() for extension in v)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize the storage type and build directory paths."""
+        self._storage_type = sys.intern(self.storage_type.lower())
+        self._pdf_storage_dir = Path(self.pdf_storage_path)
+        self._upload_dir = Path(self.upload_directory)
+
     @property
     def is_local_storage(self) -> bool:
         """Check if using local file system storage."""
-        return self.storage_type.lower() == "local"
+        return self._storage_type == "local"
 
     @property
     def is_s3_storage(self) -> bool:
         """Check if using S3 storage."""
-        return self.storage_type.lower() == "s3"
+        return self._storage_type == "s3"
 
     @property
     def pdf_storage_dir(self) -> Path:
         """Get PDF storage directory as Path object."""
-        return Path(self.pdf_storage_path)
+        return self._pdf_storage_dir
 
     @property
     def upload_dir(self) -> Path:
         """Get upload directory as Path object."""
-        return Path(self.upload_directory)
+        return self._upload_dir
 
     def ensure_directories(self) -> None:
-        """Ensure storage directories exist."""
-        if self.is_local_storage:
-            self.pdf_storage_dir.mkdir(parents=True, exist_ok=True)
-            self.upload_dir.mkdir(parents=True, exist_ok=True)
+        """Ensure storage directories exist (once per directory per process)."""
+        if not self.is_local_storage:
+            return
+
+        for directory in (self.pdf_storage_dir, self.upload_dir):
+            key = os.path.abspath(directory)
+            if key in _ensured_directories:
+                continue
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+            _ensured_directories.add(key)
 
     def is_allowed_extension(self, filename: str) -> bool:
         """Check if file extension is allowed."""
@@ -0,0 +1,203 @@
+"""
+Unified application settings combining all configuration modules.
+
+This module follows the Single Responsibility Principle by delegating
+specific configuration concerns to specialized modules, while providing
+a convenient unified interface.
+"""
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+from .application import ApplicationConfig
+from .database import DatabaseConfig
+from .whatsapp import WhatsAppConfig
+from .payment import PaymentConfig
+from .ai import AIConfig
+from .security import SecurityConfig
+from .storage import StorageConfig
+from .plex import PlexConfig
+
+
+class Settings:
+    """
+    Unified settings combining all configuration modules.
+
+    This class provides a convenient single point of access to all configuration
+    while maintaining separation of concerns through composition. Each
+    configuration module is validated on first access, so secrets for unused
+    integrations are never read.
+
+    Example:
+        >>> settings = get_settings()
+        >>> print(settings.app.name)
+        >>> print(settings.database.url)
+        >>> print(settings.whatsapp.is_configured)
+    """
+
+    # (module, check, message) triples evaluated by validate_configuration()
+    _VALIDATIONS: tuple[tuple[str, Callable[["Settings"], bool], str], ...] = (
+        (
+            "database",
+            lambda s: not s.database.url,
+            "Database URL not configured",
+        ),
+        (
+            "whatsapp",
+            lambda s: not s.whatsapp.is_configured,
+            "WhatsApp service not configured (missing auth_token or whatsapp_number)",
+        ),
+        (
+            "payment",
+            lambda s: not s.payment.is_configured,
+            "Payment gateway not configured (missing credentials)",
+        ),
+        (
+            # Production-only check
+            "security",
+            lambda s: s.is_production and not s.security.is_production_ready,
+            "Security configuration not production-ready",
+        ),
+        (
+            # AI is optional; only flag it when LangChain is enabled
+            "ai",
+            lambda s: s.ai.enable_langchain and not s.ai.is_configured,
+            "LangChain enabled but OpenAI API key not configured",
+        ),
+    )
+
+    def __init__(self):
+        """Initialize settings; configuration modules are loaded on first access."""
+        self._configuration_summary: dict | None = None
+
+        # Ensure storage directories exist
+        if self.storage.is_local_storage:
+            self.storage.ensure_directories()
+
+    @cached_property
+    def app(self) -> ApplicationConfig:
+        """Application configuration."""
+        return ApplicationConfig()
+
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        """Database configuration."""
+        return DatabaseConfig()
+
+    @cached_property
+    def whatsapp(self) -> WhatsAppConfig:
+        """WhatsApp configuration."""
+        return WhatsAppConfig()
+
+    @cached_property
+    def payment(self) -> PaymentConfig:
+        """Payment gateway configuration."""
+        return PaymentConfig()
+
+    @cached_property
+    def ai(self) -> AIConfig:
+        """AI service configuration."""
+        return AIConfig()
+
+    @cached_property
+    def security(self) -> SecurityConfig:
+        """Security configuration."""
+        return SecurityConfig()
+
+    @cached_property
+    def storage(self) -> StorageConfig:
+        """File storage configuration."""
+        return StorageConfig()
+
+    @cached_property
+    def plex(self) -> PlexConfig:
+        """Plex (ERP) integration configuration."""
+        return PlexConfig()
+
+    @property
+    def is_production(self) -> bool:
+        """Convenience property for production environment check."""
+        return self.app.is_production
+
+    @property
+    def is_development(self) -> bool:
+        """Convenience property for development environment check."""
+        return self.app.is_development
+
+    @property
+    def debug(self) -> bool:
+        """Convenience property for debug mode check."""
+        return self.app.debug
+
+    def validate_configuration(self) -> dict[str, list[str]]:
+        """
+        Validate all configuration modules and return any issues.
+
+        Returns:
+            Dictionary with configuration module names as keys and
+            lists of validation issues as values
+        """
+        issues: dict[str, list[str]] = {}
+
+        for module, has_issue, message in self._VALIDATIONS:
+            if has_issue(self):
+                issues.setdefault(module, []).append(message)
+
+        return issues
+
+    def get_configuration_summary(self) -> dict:
+        """
+        Get a summary of current configuration status.
+
+        The summary is built on first call and cached, since configuration does
+        not change after startup. Call `refresh_summary()` to rebuild it.
+
+        Returns:
+            Dictionary with configuration status information
+        """
+        if self._configuration_summary is None:
+            self._configuration_summary = self._build_configuration_summary()
+        return self._configuration_summary
+
+    def refresh_summary(self) -> None:
+        """Discard the cached configuration summary so it is rebuilt on next access."""
+        self._configuration_summary = None
+
+    def _build_configuration_summary(self) -> dict:
+        """Build the configuration summary dictionary."""
+        return {
+            "environment": self.app.environment,
+            "debug": self.app.debug,
+            "database": {
+                "type": "PostgreSQL" if self.database.is_postgresql else "SQLite",
+                "mongodb_enabled": bool(self.database.mongodb_uri),
+                "redis_enabled": bool(self.database.redis_url),
+            },
+            "integrations": {
+                "whatsapp_configured": self.whatsapp.is_configured,
+                "whatsapp_provider": self.whatsapp.provider,
+                "payment_configured": self.payment.is_configured,
+                "payment_provider": self.payment.provider,
+                "ai_enabled": self.ai.is_enabled,
+            },
+            "storage": {
+                "type": self.storage.storage_type,
+                "pdf_path": self.storage.pdf_storage_path,
+            },
+            "security": {
+                "production_ready": self.security.is_production_ready,
+                "cors_origins": len(self.security.allowed_origins),
+            },
+        }
+
+
+@lru_cache()
+def get_settings() -> Settings:
+    """
+    Get cached settings instance.
+
+    Uses LRU cache to ensure singleton pattern and avoid
+    re-reading environment variables on every call.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
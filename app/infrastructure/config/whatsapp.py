@@ -1,9 +1,12 @@
 """WhatsApp service configuration."""
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import sys
+from functools import cached_property
+from pydantic import Field, field_validator
+from pydantic_settings import SettingsConfigDict
+from .base import BaseConfig
 
 
-class WhatsAppConfig(BaseSettings):
+class WhatsAppConfig(BaseConfig):
     """
     WhatsApp integration configuration.
 
@@ -11,13 +14,8 @@ class WhatsAppConfig(BaseSettings):
     (Chattigo, Twilio, official WhatsApp Business API, etc.) without modification.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-        env_prefix="WHATSAPP_"
-    )
+    # Read-only once loaded: the shared instance is never re-validated or mutated
+    model_config = SettingsConfigDict(env_prefix="WHATSAPP_", frozen=True)
 
     # Provider Configuration
     provider: str = Field(
@@ -57,17 +55,23 @@ class WhatsAppConfig(BaseSettings):
     enable_read_receipts: bool = Field(default=True, description="Enable read receipts")
     enable_typing_indicator: bool = Field(default=True, description="Show typing indicator")
 
-    @property
+    @field_validator("provider", mode="after")
+    @classmethod
+    def normalize_provider(cls, v: str) -> str:
+        """Lower-case and intern the provider once at load time."""
+        return sys.intern(v.lower())
+
+    @cached_property
     def is_configured(self) -> bool:
         """Check if WhatsApp service is properly configured."""
         return bool(self.auth_token and self.whatsapp_number)
 
-    @property
+    @cached_property
     def is_chattigo(self) -> bool:
         """Check if using Chattigo provider."""
-        return self.provider.lower() == "chattigo"
+        return self.provider == "chattigo"
 
-    @property
+    @cached_property
     def is_twilio(self) -> bool:
         """Check if using Twilio provider."""
-        return self.provider.lower() == "twilio"
+        return self.provider == "twilio"
@@ -1,9 +1,46 @@
 """Mapper between Client entity and SQLAlchemy model."""
-from app.domain.entities import Client
+from collections.abc import Mapping
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+from app.domain.entities import Client, ClientSummary
 from app.domain.value_objects import Phone, Email, Address, TaxId, Money, ClientBalance
 from app.models.client import Client as ClientModel
 
 
+# Value objects are immutable, so instances built from identical stored values
+# are shared across rows and requests instead of being rebuilt per row
+
+@lru_cache(maxsize=10000)
+def _phone(normalized: str) -> Phone:
+    """Get the shared Phone for a stored normalized number."""
+    return Phone.from_trusted(normalized)
+
+
+@lru_cache(maxsize=1024)
+def _money(amount: Decimal) -> Money:
+    """Get the shared ARS Money for a stored amount (most often zero)."""
+    return Money.from_trusted(amount, "ARS")
+
+
+@lru_cache(maxsize=4096)
+def _address(
+    street: str | None,
+    city: str | None,
+    state: str | None,
+    postal_code: str | None,
+) -> Address:
+    """Get the shared Address for stored address columns (often all empty)."""
+    return Address.create(
+        street=street,
+        city=city,
+        state=state,
+        postal_code=postal_code,
+        country="AR"
+    )
+
+
 class ClientMapper:
     """
     Maps between Client domain entity and ClientModel (SQLAlchemy).
@@ -12,6 +49,42 @@ class ClientMapper:
     persistence model, preserving all business logic in the domain layer.
     """
 
+    # Columns read by `to_entity`; list queries select only these
+    ENTITY_COLUMNS: tuple[str, ...] = (
+        "id",
+        "pharmacy_id",
+        "external_id",
+        "phone_normalized",
+        "first_name",
+        "last_name",
+        "email",
+        "tax_id",
+        "address",
+        "city",
+        "state",
+        "postal_code",
+        "whatsapp_name",
+        "whatsapp_opted_in",
+        "last_whatsapp_interaction",
+        "credit_limit",
+        "current_balance",
+        "status",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+        "tags",
+        "notes",
+    )
+
+    # Columns read by `to_summary_from_row`
+    SUMMARY_COLUMNS: tuple[str, ...] = (
+        "id",
+        "phone_normalized",
+        "status",
+        "credit_limit",
+        "current_balance",
+    )
+
     @staticmethod
     def to_model(entity: Client) -> ClientModel:
         """
@@ -23,33 +96,60 @@ class ClientMapper:
         Returns:
             ClientModel for persistence
         """
-        return ClientModel(
-            id=entity.id,
-            pharmacy_id=entity.pharmacy_id,
-            external_id=entity.external_id,
-            phone=entity.phone.value,
-            phone_normalized=entity.phone.normalized,
-            first_name=entity.first_name,
-            last_name=entity.last_name,
-            full_name=entity.full_name,
-            email=str(entity.email) if entity.email else None,
-            tax_id=str(entity.tax_id) if entity.tax_id else None,
-            address=entity.address.street if entity.address else None,
-            city=entity.address.city if entity.address else None,
-            state=entity.address.state if entity.address else None,
-            postal_code=entity.address.postal_code if entity.address else None,
-            whatsapp_name=entity.whatsapp_name,
-            whatsapp_opted_in=entity.whatsapp_opted_in,
-            last_whatsapp_interaction=entity.last_whatsapp_interaction,
-            credit_limit=entity.balance.credit_limit.amount,
-            current_balance=entity.balance.current_balance.amount,
-            status=entity.status,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-            deleted_at=entity.deleted_at,
-            tags=entity.tags,
-            notes=entity.notes,
-        )
+        return ClientModel(**ClientMapper.to_insert_dict(entity))
+
+    @staticmethod
+    def to_insert_dict(entity: Client) -> dict[str, Any]:
+        """
+        Convert domain entity to column values for a Core INSERT.
+
+        Args:
+            entity: Client domain entity
+
+        Returns:
+            Column name to value mapping
+        """
+        # Read each nested value object once
+        phone = entity.phone
+        email = entity.email
+        tax_id = entity.tax_id
+        address = entity.address
+        balance = entity.balance
+
+        if address:
+            street, city, state, postal_code = (
+                address.street, address.city, address.state, address.postal_code
+            )
+        else:
+            street = city = state = postal_code = None
+
+        return {
+            "id": entity.id,
+            "pharmacy_id": entity.pharmacy_id,
+            "external_id": entity.external_id,
+            "phone": phone.value,
+            "phone_normalized": phone.normalized,
+            "first_name": entity.first_name,
+            "last_name": entity.last_name,
+            "full_name": entity.full_name,
+            "email": str(email) if email else None,
+            "tax_id": str(tax_id) if tax_id else None,
+            "address": street,
+            "city": city,
+            "state": state,
+            "postal_code": postal_code,
+            "whatsapp_name": entity.whatsapp_name,
+            "whatsapp_opted_in": entity.whatsapp_opted_in,
+            "last_whatsapp_interaction": entity.last_whatsapp_interaction,
+            "credit_limit": balance.credit_limit.amount,
+            "current_balance": balance.current_balance.amount,
+            "status": entity.status,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+            "deleted_at": entity.deleted_at,
+            "tags": entity.tags,
+            "notes": entity.notes,
+        }
 
     @staticmethod
     def to_entity(model: ClientModel) -> Client:
@@ -59,60 +159,110 @@ class ClientMapper:
         Args:
             model: ClientModel from database
 
+        Returns:
+            Client domain entity
+        """
+        return ClientMapper.to_entity_from_row(
+            {column: getattr(model, column) for column in ClientMapper.ENTITY_COLUMNS}
+        )
+
+    @staticmethod
+    def to_entity_from_row(row: Mapping[str, Any]) -> Client:
+        """
+        Convert a plain result row to domain entity.
+
+        Used by list queries that select `ENTITY_COLUMNS` directly, so no
+        ORM instances are built for the rows. Stored values were validated
+        when written, so value objects are built without re-validating.
+
+        Args:
+            row: Column name to value mapping (e.g. `Result.mappings()` row)
+
         Returns:
             Client domain entity
         """
         # Create value objects
-        phone = Phone.from_normalized(model.phone_normalized)
+        phone = _phone(row["phone_normalized"])
 
         email = None
-        if model.email:
-            email = Email.create(model.email)
+        if row["email"]:
+            email = Email.from_trusted(row["email"])
 
         tax_id = None
-        if model.tax_id:
-            tax_id = TaxId.create(model.tax_id)
-
-        address = Address.create(
-            street=model.address,
-            city=model.city,
-            state=model.state,
-            postal_code=model.postal_code,
-            country="AR"
-        )
+        if row["tax_id"]:
+            tax_id = TaxId.create(row["tax_id"])
+
+        address = _address(row["address"], row["city"], row["state"], row["postal_code"])
 
         # Create balance
-        credit_limit = Money.create(model.credit_limit, "ARS")
-        current_balance = Money.create(model.current_balance, "ARS")
-        balance = ClientBalance.create(current_balance, credit_limit)
+        credit_limit = _money(row["credit_limit"])
+        current_balance = _money(row["current_balance"])
+        balance = ClientBalance.from_trusted(current_balance, credit_limit)
 
         # Create entity
         client = Client(
-            pharmacy_id=model.pharmacy_id,
+            pharmacy_id=row["pharmacy_id"],
             phone=phone,
             balance=balance,
-            status=model.status,
-            first_name=model.first_name,
-            last_name=model.last_name,
+            status=row["status"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
             email=email,
             tax_id=tax_id,
             address=address,
-            whatsapp_name=model.whatsapp_name,
-            whatsapp_opted_in=model.whatsapp_opted_in,
-            last_whatsapp_interaction=model.last_whatsapp_interaction,
-            tags=model.tags or [],
-            notes=model.notes,
-            external_id=model.external_id,
+            whatsapp_name=row["whatsapp_name"],
+            whatsapp_opted_in=row["whatsapp_opted_in"],
+            last_whatsapp_interaction=row["last_whatsapp_interaction"],
+            tags=row["tags"] or [],
+            notes=row["notes"],
+            external_id=row["external_id"],
         )
 
         # Set timestamps and ID from database
-        client.id = model.id
-        client.created_at = model.created_at
-        client.updated_at = model.updated_at
-        client.deleted_at = model.deleted_at
+        client.id = row["id"]
+        client.created_at = row["created_at"]
+        client.updated_at = row["updated_at"]
+        client.deleted_at = row["deleted_at"]
 
         return client
 
+    @staticmethod
+    def to_summary_from_row(row: Mapping[str, Any]) -> ClientSummary:
+        """
+        Convert a plain result row selecting `SUMMARY_COLUMNS` to a client summary.
+
+        Args:
+            row: Column name to value mapping (e.g. `Result.mappings()` row)
+
+        Returns:
+            ClientSummary read model
+        """
+        return ClientSummary(
+            id=row["id"],
+            phone=_phone(row["phone_normalized"]),
+            status=row["status"],
+            balance=ClientBalance.from_trusted(
+                _money(row["current_balance"]), _money(row["credit_limit"])
+            ),
+        )
+
+    @staticmethod
+    def to_update_dict(entity: Client) -> dict[str, Any]:
+        """
+        Convert domain entity to column values for a Core UPDATE.
+
+        The primary key and creation timestamp are never updated.
+
+        Args:
+            entity: Client entity with new data
+
+        Returns:
+            Column name to value mapping
+        """
+        values = ClientMapper.to_insert_dict(entity)
+        del values["id"], values["created_at"]
+        return values
+
     @staticmethod
     def update_model_from_entity(model: ClientModel, entity: Client) -> None:
         """
@@ -122,26 +272,5 @@ class ClientMapper:
             model: Existing ClientModel to update
             entity: Client entity with new data
         """
-        model.pharmacy_id = entity.pharmacy_id
-        model.external_id = entity.external_id
-        model.phone = entity.phone.value
-        model.phone_normalized = entity.phone.normalized
-        model.first_name = entity.first_name
-        model.last_name = entity.last_name
-        model.full_name = entity.full_name
-        model.email = str(entity.email) if entity.email else None
-        model.tax_id = str(entity.tax_id) if entity.tax_id else None
-        model.address = entity.address.street if entity.address else None
-        model.city = entity.address.city if entity.address else None
-        model.state = entity.address.state if entity.address else None
-        model.postal_code = entity.address.postal_code if entity.address else None
-        model.whatsapp_name = entity.whatsapp_name
-        model.whatsapp_opted_in = entity.whatsapp_opted_in
-        model.last_whatsapp_interaction = entity.last_whatsapp_interaction
-        model.credit_limit = entity.balance.credit_limit.amount
-        model.current_balance = entity.balance.current_balance.amount
-        model.status = entity.status
-        model.updated_at = entity.updated_at
-        model.deleted_at = entity.deleted_at
-        model.tags = entity.tags
-        model.notes = entity.notes
+        for column, value in ClientMapper.to_update_dict(entity).items():
+            setattr(model, column, value)
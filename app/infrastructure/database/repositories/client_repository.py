@@ -1,14 +1,53 @@
 """Client repository implementation with SQLAlchemy."""
+import json
+from collections.abc import AsyncIterator
+from decimal import Decimal
 from uuid import UUID
-from sqlalchemy import select, func, or_
+from sqlalchemy import Select, bindparam, lambda_stmt, select, insert, update, exists, func, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.interfaces.repositories import IClientRepository
-from app.domain.entities import Client
+from app.domain.entities import Client, ClientSummary
 from app.domain.value_objects import Phone
-from app.models.client import Client as ClientModel
+from app.models.client import Client as ClientModel, client_search_filter
+from app.models.pharmacy_client_counter import PharmacyClientCounter
 from app.infrastructure.database.mappers.client_mapper import ClientMapper
 
+# Columns selected by list queries, mapped straight to entities without ORM instances
+_ENTITY_COLUMNS = tuple(getattr(ClientModel, column) for column in ClientMapper.ENTITY_COLUMNS)
+_SUMMARY_COLUMNS = tuple(getattr(ClientModel, column) for column in ClientMapper.SUMMARY_COLUMNS)
+
+# Hot lookups as lambda statements: SQLAlchemy caches their construction and
+# compiled SQL, so each call only binds new parameter values
+_FIND_BY_ID = lambda_stmt(
+    lambda: select(*_ENTITY_COLUMNS).where(ClientModel.id == bindparam("entity_id"))
+)
+_FIND_SUMMARY_BY_ID = lambda_stmt(
+    lambda: select(*_SUMMARY_COLUMNS).where(ClientModel.id == bindparam("entity_id"))
+)
+_EXISTS = lambda_stmt(
+    lambda: select(exists().where(ClientModel.id == bindparam("entity_id")))
+)
+_FIND_BY_PHONE = lambda_stmt(
+    lambda: select(*_ENTITY_COLUMNS).where(
+        ClientModel.pharmacy_id == bindparam("pharmacy_id"),
+        ClientModel.phone_normalized == bindparam("phone_normalized")
+    )
+)
+_FIND_SUMMARY_BY_PHONE = lambda_stmt(
+    lambda: select(*_SUMMARY_COLUMNS).where(
+        ClientModel.pharmacy_id == bindparam("pharmacy_id"),
+        ClientModel.phone_normalized == bindparam("phone_normalized")
+    )
+)
+_COUNT_BY_PHARMACY = lambda_stmt(
+    lambda: select(func.count()).select_from(ClientModel).where(
+        ClientModel.pharmacy_id == bindparam("pharmacy_id")
+    )
+)
+
 
 class ClientRepository(IClientRepository):
     """
@@ -18,6 +57,9 @@ class ClientRepository(IClientRepository):
     and provides query methods for client data access.
     """
 
+    # Built per request; slots avoid a per-instance __dict__
+    __slots__ = ("_session",)
+
     def __init__(self, session: AsyncSession):
         """
         Initialize repository with database session.
@@ -26,23 +68,54 @@ class ClientRepository(IClientRepository):
             session: SQLAlchemy async session
         """
         self._session = session
-        self._mapper = ClientMapper()
+
+    async def _fetch_entities(self, query: Select) -> list[Client]:
+        """Execute a column query built on `_ENTITY_COLUMNS` and map its rows."""
+        result = await self._session.execute(query)
+        return [ClientMapper.to_entity_from_row(row) for row in result.mappings()]
+
+    async def _stream_entities(self, query: Select, batch_size: int) -> AsyncIterator[Client]:
+        """Stream a column query built on `_ENTITY_COLUMNS`, mapping rows batch by batch."""
+        result = await self._session.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            for row in partition:
+                yield ClientMapper.to_entity_from_row(row)
+
+    def _supports_estimates(self) -> bool:
+        """Check if the session is bound to PostgreSQL, which provides row estimates."""
+        return self._session.get_bind().dialect.name == "postgresql"
+
+    async def _estimate_rows(self, query: Select) -> int:
+        """Get the PostgreSQL planner's row estimate for a query without running it."""
+        sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        result = await self._session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
 
     async def create(self, data: Client) -> Client:
         """Create a new client."""
-        model = self._mapper.to_model(data)
-        self._session.add(model)
+        result = await self._session.execute(
+            insert(ClientModel)
+            .values(**ClientMapper.to_insert_dict(data))
+            .returning(*_ENTITY_COLUMNS)
+        )
+        row = result.mappings().one()
         await self._session.commit()
-        await self._session.refresh(model)
-        return self._mapper.to_entity(model)
+        return ClientMapper.to_entity_from_row(row)
 
     async def find_by_id(self, entity_id: UUID) -> Client | None:
         """Find client by ID."""
-        result = await self._session.execute(
-            select(ClientModel).where(ClientModel.id == entity_id)
-        )
-        model = result.scalar_one_or_none()
-        return self._mapper.to_entity(model) if model else None
+        result = await self._session.execute(_FIND_BY_ID, {"entity_id": entity_id})
+        row = result.mappings().one_or_none()
+        return ClientMapper.to_entity_from_row(row) if row else None
+
+    async def find_summary_by_id(self, entity_id: UUID) -> ClientSummary | None:
+        """Find a client's summary by ID, reading only the summary columns."""
+        result = await self._session.execute(_FIND_SUMMARY_BY_ID, {"entity_id": entity_id})
+        row = result.mappings().one_or_none()
+        return ClientMapper.to_summary_from_row(row) if row else None
 
     async def find_all(
         self,
@@ -51,7 +124,7 @@ class ClientRepository(IClientRepository):
         filters: dict | None = None
     ) -> list[Client]:
         """Find all clients with pagination."""
-        query = select(ClientModel).offset(skip).limit(limit)
+        query = select(*_ENTITY_COLUMNS).offset(skip).limit(limit)
 
         if filters:
             if "pharmacy_id" in filters:
@@ -59,60 +132,75 @@ class ClientRepository(IClientRepository):
             if "status" in filters:
                 query = query.where(ClientModel.status == filters["status"])
 
-        result = await self._session.execute(query)
-        models = result.scalars().all()
-        return [self._mapper.to_entity(model) for model in models]
+        return await self._fetch_entities(query)
 
     async def update(self, entity_id: UUID, data: Client) -> Client | None:
         """Update an existing client."""
         result = await self._session.execute(
-            select(ClientModel).where(ClientModel.id == entity_id)
+            update(ClientModel)
+            .where(ClientModel.id == entity_id)
+            .values(**ClientMapper.to_update_dict(data))
+            .returning(*_ENTITY_COLUMNS)
         )
-        model = result.scalar_one_or_none()
+        row = result.mappings().one_or_none()
 
-        if not model:
+        if not row:
             return None
 
-        self._mapper.update_model_from_entity(model, data)
         await self._session.commit()
-        await self._session.refresh(model)
-        return self._mapper.to_entity(model)
+        return ClientMapper.to_entity_from_row(row)
 
     async def delete(self, entity_id: UUID) -> bool:
         """Delete a client (soft delete)."""
         result = await self._session.execute(
-            select(ClientModel).where(ClientModel.id == entity_id)
+            update(ClientModel)
+            .where(ClientModel.id == entity_id)
+            .values(deleted_at=func.now())
+            .returning(ClientModel.id)
         )
-        model = result.scalar_one_or_none()
 
-        if not model:
+        if result.scalar_one_or_none() is None:
             return False
 
-        # Soft delete
-        from datetime import datetime
-        model.deleted_at = datetime.utcnow()
         await self._session.commit()
         return True
 
     async def exists(self, entity_id: UUID) -> bool:
         """Check if client exists."""
-        result = await self._session.execute(
-            select(func.count()).select_from(ClientModel).where(ClientModel.id == entity_id)
-        )
-        count = result.scalar()
-        return bool(count and count > 0)
+        result = await self._session.execute(_EXISTS, {"entity_id": entity_id})
+        return bool(result.scalar())
 
-    async def count(self, filters: dict | None = None) -> int:
-        """Count clients."""
-        query = select(func.count()).select_from(ClientModel)
+    async def count(self, filters: dict | None = None, approx: bool = False) -> int:
+        """
+        Count clients.
+
+        With `approx=True` on PostgreSQL, returns the statistics-based
+        estimate (table `reltuples`, or the planner estimate when filtered)
+        instead of scanning; meant for pagination totals and dashboards.
+        """
+        conditions = []
 
         if filters:
             if "pharmacy_id" in filters:
-                query = query.where(ClientModel.pharmacy_id == filters["pharmacy_id"])
+                conditions.append(ClientModel.pharmacy_id == filters["pharmacy_id"])
             if "status" in filters:
-                query = query.where(ClientModel.status == filters["status"])
+                conditions.append(ClientModel.status == filters["status"])
 
-        result = await self._session.execute(query)
+        if approx and self._supports_estimates():
+            if conditions:
+                return await self._estimate_rows(select(ClientModel.id).where(*conditions))
+
+            result = await self._session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'clients'::regclass")
+            )
+            estimate = result.scalar()
+            # Negative until the table has been vacuumed/analyzed; count exactly then
+            if estimate is not None and estimate >= 0:
+                return estimate
+
+        result = await self._session.execute(
+            select(func.count()).select_from(ClientModel).where(*conditions)
+        )
         count = result.scalar()
         return count if count is not None else 0
 
@@ -125,13 +213,24 @@ class ClientRepository(IClientRepository):
     ) -> Client | None:
         """Find client by phone number within a pharmacy."""
         result = await self._session.execute(
-            select(ClientModel).where(
-                ClientModel.pharmacy_id == pharmacy_id,
-                ClientModel.phone_normalized == phone.normalized
-            )
+            _FIND_BY_PHONE,
+            {"pharmacy_id": pharmacy_id, "phone_normalized": phone.normalized}
         )
-        model = result.scalar_one_or_none()
-        return self._mapper.to_entity(model) if model else None
+        row = result.mappings().one_or_none()
+        return ClientMapper.to_entity_from_row(row) if row else None
+
+    async def find_summary_by_phone(
+        self,
+        phone: Phone,
+        pharmacy_id: UUID
+    ) -> ClientSummary | None:
+        """Find a client's summary by phone number, served by the covering unique index."""
+        result = await self._session.execute(
+            _FIND_SUMMARY_BY_PHONE,
+            {"pharmacy_id": pharmacy_id, "phone_normalized": phone.normalized}
+        )
+        row = result.mappings().one_or_none()
+        return ClientMapper.to_summary_from_row(row) if row else None
 
     async def find_by_pharmacy(
         self,
@@ -140,14 +239,12 @@ class ClientRepository(IClientRepository):
         limit: int = 100
     ) -> list[Client]:
         """Find all clients for a pharmacy."""
-        result = await self._session.execute(
-            select(ClientModel)
+        return await self._fetch_entities(
+            select(*_ENTITY_COLUMNS)
             .where(ClientModel.pharmacy_id == pharmacy_id)
             .offset(skip)
             .limit(limit)
         )
-        models = result.scalars().all()
-        return [self._mapper.to_entity(model) for model in models]
 
     async def find_active_by_pharmacy(
         self,
@@ -156,8 +253,8 @@ class ClientRepository(IClientRepository):
         limit: int = 100
     ) -> list[Client]:
         """Find active clients for a pharmacy."""
-        result = await self._session.execute(
-            select(ClientModel)
+        return await self._fetch_entities(
+            select(*_ENTITY_COLUMNS)
             .where(
                 ClientModel.pharmacy_id == pharmacy_id,
                 ClientModel.status == "active"
@@ -165,8 +262,6 @@ class ClientRepository(IClientRepository):
             .offset(skip)
             .limit(limit)
         )
-        models = result.scalars().all()
-        return [self._mapper.to_entity(model) for model in models]
 
     async def find_with_debt(
         self,
@@ -175,8 +270,8 @@ class ClientRepository(IClientRepository):
         limit: int = 100
     ) -> list[Client]:
         """Find clients with outstanding debt."""
-        result = await self._session.execute(
-            select(ClientModel)
+        return await self._fetch_entities(
+            select(*_ENTITY_COLUMNS)
             .where(
                 ClientModel.pharmacy_id == pharmacy_id,
                 ClientModel.current_balance < 0
@@ -184,8 +279,6 @@ class ClientRepository(IClientRepository):
             .offset(skip)
             .limit(limit)
         )
-        models = result.scalars().all()
-        return [self._mapper.to_entity(model) for model in models]
 
     async def find_by_tag(
         self,
@@ -195,8 +288,8 @@ class ClientRepository(IClientRepository):
         limit: int = 100
     ) -> list[Client]:
         """Find clients by tag."""
-        result = await self._session.execute(
-            select(ClientModel)
+        return await self._fetch_entities(
+            select(*_ENTITY_COLUMNS)
             .where(
                 ClientModel.pharmacy_id == pharmacy_id,
                 ClientModel.tags.contains([tag])
@@ -204,8 +297,6 @@ class ClientRepository(IClientRepository):
             .offset(skip)
             .limit(limit)
         )
-        models = result.scalars().all()
-        return [self._mapper.to_entity(model) for model in models]
 
     async def search(
         self,
@@ -215,41 +306,114 @@ class ClientRepository(IClientRepository):
         limit: int = 100
     ) -> list[Client]:
         """Search clients by name, phone, or email."""
-        search_pattern = f"%{query}%"
-        result = await self._session.execute(
-            select(ClientModel)
-            .where(
-                ClientModel.pharmacy_id == pharmacy_id,
-                or_(
-                    ClientModel.first_name.ilike(search_pattern),
-                    ClientModel.last_name.ilike(search_pattern),
-                    ClientModel.full_name.ilike(search_pattern),
-                    ClientModel.phone.ilike(search_pattern),
-                    ClientModel.email.ilike(search_pattern)
-                )
-            )
-            .offset(skip)
-            .limit(limit)
+        return await self._fetch_entities(
+            self._search_query(query, pharmacy_id).offset(skip).limit(limit)
         )
-        models = result.scalars().all()
-        return [self._mapper.to_entity(model) for model in models]
 
-    async def count_by_pharmacy(self, pharmacy_id: UUID) -> int:
-        """Count clients for a pharmacy."""
-        result = await self._session.execute(
-            select(func.count()).select_from(ClientModel).where(
-                ClientModel.pharmacy_id == pharmacy_id
-            )
+    def iter_by_pharmacy(
+        self,
+        pharmacy_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[Client]:
+        """Stream all clients of a pharmacy, fetching `batch_size` rows at a time."""
+        return self._stream_entities(
+            select(*_ENTITY_COLUMNS).where(ClientModel.pharmacy_id == pharmacy_id),
+            batch_size
+        )
+
+    def search_iter(
+        self,
+        query: str,
+        pharmacy_id: UUID,
+        batch_size: int = 500
+    ) -> AsyncIterator[Client]:
+        """Stream all clients matching a search, fetching `batch_size` rows at a time."""
+        return self._stream_entities(self._search_query(query, pharmacy_id), batch_size)
+
+    @staticmethod
+    def _search_query(query: str, pharmacy_id: UUID) -> Select:
+        """Build the client search query on the trigram-indexed expression."""
+        return select(*_ENTITY_COLUMNS).where(
+            ClientModel.pharmacy_id == pharmacy_id,
+            client_search_filter(query)
         )
+
+    async def count_by_pharmacy(self, pharmacy_id: UUID, approx: bool = False) -> int:
+        """Count clients for a pharmacy, optionally from the planner estimate."""
+        if approx and self._supports_estimates():
+            return await self._estimate_rows(
+                select(ClientModel.id).where(ClientModel.pharmacy_id == pharmacy_id)
+            )
+
+        result = await self._session.execute(_COUNT_BY_PHARMACY, {"pharmacy_id": pharmacy_id})
         count = result.scalar()
         return count if count is not None else 0
 
     async def get_next_external_id(self, pharmacy_id: UUID) -> int:
-        """Get next available external ID for a pharmacy."""
+        """
+        Get next available external ID for a pharmacy.
+
+        Claims the ID from the pharmacy's counter row in the caller's
+        transaction; the row lock serializes concurrent inserts.
+        """
+        claim = (
+            update(PharmacyClientCounter)
+            .where(PharmacyClientCounter.pharmacy_id == pharmacy_id)
+            .values(next_id=PharmacyClientCounter.next_id + 1)
+            .returning(PharmacyClientCounter.next_id - 1)
+        )
+        result = await self._session.execute(claim)
+        next_id = result.scalar_one_or_none()
+        if next_id is not None:
+            return next_id
+
+        # First claim for this pharmacy: seed the counter from existing clients
         result = await self._session.execute(
             select(func.max(ClientModel.external_id)).where(
                 ClientModel.pharmacy_id == pharmacy_id
             )
         )
         max_id = result.scalar()
-        return int(max_id) + 1 if max_id else 1
+        next_id = int(max_id) + 1 if max_id else 1
+
+        try:
+            async with self._session.begin_nested():
+                await self._session.execute(
+                    insert(PharmacyClientCounter).values(
+                        pharmacy_id=pharmacy_id,
+                        next_id=next_id + 1
+                    )
+                )
+        except IntegrityError:
+            # Seeded concurrently by another transaction
+            result = await self._session.execute(claim)
+            return result.scalar_one()
+
+        return next_id
+
+    async def bulk_create(self, clients: list[Client]) -> list[Client]:
+        """Create many clients with a single executemany INSERT."""
+        if not clients:
+            return []
+
+        # Entities carry their own IDs and timestamps, so nothing is read back
+        await self._session.execute(
+            insert(ClientModel),
+            [ClientMapper.to_insert_dict(client) for client in clients]
+        )
+        await self._session.commit()
+        return clients
+
+    async def bulk_update_balances(self, updates: list[tuple[UUID, Decimal]]) -> None:
+        """Set many client balances with a single executemany UPDATE by primary key."""
+        if not updates:
+            return
+
+        await self._session.execute(
+            update(ClientModel),
+            [
+                {"id": client_id, "current_balance": balance}
+                for client_id, balance in updates
+            ]
+        )
+        await self._session.commit()
@@ -1,9 +1,10 @@
 """Dependency injection system for the application."""
 from .container import DependencyContainer, get_container, container
-from .database import get_db, get_mongodb, get_redis
+from .database import get_db, get_mongodb, get_redis, close_clients
 from .use_cases import (
     CreateClientUseCaseDep,
     GetClientUseCaseDep,
+    GetClientSummaryUseCaseDep,
     CreateTransactionUseCaseDep,
     ProcessPaymentUseCaseDep,
 )
@@ -17,9 +18,11 @@ __all__ = [
     "get_db",
     "get_mongodb",
     "get_redis",
+    "close_clients",
     # Use Cases
     "CreateClientUseCaseDep",
     "GetClientUseCaseDep",
+    "GetClientSummaryUseCaseDep",
     "CreateTransactionUseCaseDep",
     "ProcessPaymentUseCaseDep",
 ]
@@ -16,7 +16,9 @@ class DependencyContainer:
     Simple dependency injection container.
 
     Manages singleton and factory dependencies, providing them
-    when requested by the application.
+    when requested by the application. A registered singleton takes
+    precedence over any factory or implementation registered for the same
+    interface, before or after it.
 
     Example:
         >>> container = DependencyContainer()
@@ -24,10 +26,15 @@ class DependencyContainer:
         >>> repo = container.resolve(IClientRepository)
     """
 
+    __slots__ = ("_resolvers", "_singletons", "_instances")
+
     def __init__(self):
         """Initialize the container with empty registries."""
-        self._singletons: dict[Type, Any] = {}
-        self._factories: dict[Type, Callable] = {}
+        # One resolver per interface, bound at registration time so resolve()
+        # is a single lookup and call
+        self._resolvers: dict[Type, Callable[..., Any]] = {}
+        # Interfaces registered with a singleton; factories do not replace them
+        self._singletons: set[Type] = set()
         self._instances: dict[Type, Any] = {}
 
     def register_singleton(self, interface: Type[T], instance: T) -> None:
@@ -40,32 +47,37 @@ class DependencyContainer:
             interface: The interface/abstract type
             instance: The concrete instance to register
         """
-        self._singletons[interface] = instance
+        self._resolvers[interface] = lambda **kwargs: instance
+        self._singletons.add(interface)
         self._instances[interface] = instance
 
     def register_factory(self, interface: Type[T], factory: Callable[..., T]) -> None:
         """
         Register a factory function for an interface.
 
-        A new instance will be created on every resolve() call.
+        A new instance will be created on every resolve() call, unless a
+        singleton is registered for the interface.
 
         Args:
             interface: The interface/abstract type
             factory: A callable that creates instances
         """
-        self._factories[interface] = factory
+        if interface not in self._singletons:
+            self._resolvers[interface] = factory
 
     def register(self, interface: Type[T], implementation: Type[T]) -> None:
         """
         Register an implementation for an interface.
 
-        Creates instances using the implementation's constructor.
+        Creates instances using the implementation's constructor, unless a
+        singleton is registered for the interface.
 
         Args:
             interface: The interface/abstract type
             implementation: The concrete implementation type
         """
-        self._factories[interface] = implementation
+        if interface not in self._singletons:
+            self._resolvers[interface] = implementation
 
     def resolve(self, interface: Type[T], **kwargs) -> T:
         """
@@ -81,17 +93,12 @@ class DependencyContainer:
         Raises:
             KeyError: If the interface is not registered
         """
-        # Check for singleton first
-        if interface in self._singletons:
-            return self._singletons[interface]
-
-        # Check for factory
-        if interface in self._factories:
-            factory = self._factories[interface]
-            instance = factory(**kwargs)
-            return instance
+        try:
+            resolver = self._resolvers[interface]
+        except KeyError:
+            raise KeyError(f"No registration found for {interface}") from None
 
-        raise KeyError(f"No registration found for {interface}")
+        return resolver(**kwargs)
 
     def resolve_singleton(self, interface: Type[T], **kwargs) -> T:
         """
@@ -112,8 +119,8 @@ class DependencyContainer:
 
     def clear(self) -> None:
         """Clear all registrations and instances."""
+        self._resolvers.clear()
         self._singletons.clear()
-        self._factories.clear()
         self._instances.clear()
 
     def is_registered(self, interface: Type) -> bool:
@@ -126,7 +133,7 @@ class DependencyContainer:
         Returns:
             True if registered, False otherwise
         """
-        return interface in self._singletons or interface in self._factories
+        return interface in self._resolvers
 
 
 @lru_cache()
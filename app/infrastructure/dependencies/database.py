@@ -7,6 +7,54 @@ import redis.asyncio as aioredis
 from app.db.session import async_session
 from app.infrastructure.config import get_settings
 
+# Shared clients: created on first use, pooled across requests and closed on
+# application shutdown (see `close_clients`)
+_mongo_client: AsyncIOMotorClient | None = None
+_redis_client: aioredis.Redis | None = None
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """
+    Get the shared MongoDB client, creating it on first use.
+
+    Returns:
+        AsyncIOMotorClient: Motor client with its own connection pool
+    """
+    global _mongo_client
+    if _mongo_client is None:
+        settings = get_settings()
+        _mongo_client = AsyncIOMotorClient(settings.database.mongodb_uri)
+    return _mongo_client
+
+
+def get_redis_client() -> aioredis.Redis:
+    """
+    Get the shared Redis client, creating it on first use.
+
+    Returns:
+        aioredis.Redis: Redis client backed by a connection pool
+    """
+    global _redis_client
+    if _redis_client is None:
+        settings = get_settings()
+        _redis_client = aioredis.from_url(
+            settings.database.redis_url,
+            decode_responses=settings.database.redis_decode_responses,
+            max_connections=settings.database.redis_max_connections
+        )
+    return _redis_client
+
+
+async def close_clients() -> None:
+    """Close the shared MongoDB and Redis clients, if they were created."""
+    global _mongo_client, _redis_client
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -42,13 +90,7 @@ async def get_mongodb() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
         >>>     return messages
     """
     settings = get_settings()
-    client = AsyncIOMotorClient(settings.database.mongodb_uri)
-    db = client[settings.database.mongodb_database_name]
-
-    try:
-        yield db
-    finally:
-        client.close()
+    yield get_mongo_client()[settings.database.mongodb_database_name]
 
 
 async def get_redis() -> AsyncGenerator[aioredis.Redis, None]:
@@ -64,14 +106,4 @@ async def get_redis() -> AsyncGenerator[aioredis.Redis, None]:
         >>>     value = await redis.get("key")
         >>>     return {"value": value}
     """
-    settings = get_settings()
-    redis_client = aioredis.from_url(
-        settings.database.redis_url,
-        decode_responses=settings.database.redis_decode_responses,
-        max_connections=settings.database.redis_max_connections
-    )
-
-    try:
-        yield redis_client
-    finally:
-        await redis_client.close()
+    yield get_redis_client()
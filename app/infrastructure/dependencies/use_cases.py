@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.use_cases import (
     CreateClientUseCase,
     GetClientUseCase,
+    GetClientSummaryUseCase,
     CreateTransactionUseCase,
     ProcessPaymentUseCase,
 )
@@ -48,6 +49,22 @@ def get_get_client_use_case(
     return GetClientUseCase(client_repository=client_repository)
 
 
+def get_get_client_summary_use_case(
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> GetClientSummaryUseCase:
+    """
+    Provide GetClientSummaryUseCase with dependencies.
+
+    Args:
+        db: Database session
+
+    Returns:
+        GetClientSummaryUseCase instance
+    """
+    client_repository = ClientRepository(db)
+    return GetClientSummaryUseCase(client_repository=client_repository)
+
+
 # Transaction Use Cases
 
 def get_create_transaction_use_case(
@@ -107,5 +124,6 @@ def get_process_payment_use_case(
 # Type aliases for cleaner endpoint signatures
 CreateClientUseCaseDep = Annotated[CreateClientUseCase, Depends(get_create_client_use_case)]
 GetClientUseCaseDep = Annotated[GetClientUseCase, Depends(get_get_client_use_case)]
+GetClientSummaryUseCaseDep = Annotated[GetClientSummaryUseCase, Depends(get_get_client_summary_use_case)]
 CreateTransactionUseCaseDep = Annotated[CreateTransactionUseCase, Depends(get_create_transaction_use_case)]
 ProcessPaymentUseCaseDep = Annotated[ProcessPaymentUseCase, Depends(get_process_payment_use_case)]
@@ -0,0 +1,35 @@
+"""Shared HTTP client for external service adapters."""
+import httpx
+
+# One client for all outbound integrations: connections (and their TLS
+# sessions) are pooled and reused across adapters and requests, and closed on
+# application shutdown (see `close_http_client`)
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Adapters pass their base URL, credentials and timeout per request, so a
+    single HTTP/2-capable connection pool serves every external service.
+
+    Returns:
+        httpx.AsyncClient: Shared async HTTP client
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            timeout=httpx.Timeout(10.0, connect=2.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -1,9 +1,18 @@
 """MercadoPago payment gateway adapter."""
-import mercadopago
+import httpx
+import orjson
 
 from app.domain.interfaces.services import IPaymentGateway
 from app.domain.exceptions import PaymentGatewayError
 from app.infrastructure.config import PaymentConfig
+from app.infrastructure.external.http_client import get_http_client
+from app.infrastructure.external.resilience import (
+    get_bulkhead,
+    get_circuit_breaker,
+    send_with_retry,
+)
+
+MERCADOPAGO_API_URL = "https://api.mercadopago.com"
 
 
 class MercadoPagoAdapter(IPaymentGateway):
@@ -14,22 +23,73 @@ class MercadoPagoAdapter(IPaymentGateway):
     through MercadoPago platform.
 
     Follows the Adapter Pattern to decouple payment processing
-    from specific gateway implementations.
+    from specific gateway implementations. Calls MercadoPago's REST API
+    through the shared async HTTP client, so requests never block the
+    event loop.
     """
 
-    def __init__(self, config: PaymentConfig):
+    def __init__(self, config: PaymentConfig, client: httpx.AsyncClient | None = None):
         """
         Initialize MercadoPago adapter.
 
         Args:
             config: Payment configuration
+            client: HTTP client to use (defaults to the shared client)
         """
         self._config = config
 
         if not config.is_configured:
             raise ValueError("MercadoPago not properly configured")
 
-        self._sdk = mercadopago.SDK(config.mercadopago_access_token)
+        self._headers = {
+            "Authorization": f"Bearer {config.mercadopago_access_token}",
+            "Content-Type": "application/json",
+        }
+        self._client = client or get_http_client()
+        self._breaker = get_circuit_breaker("mercadopago")
+        self._bulkhead = get_bulkhead("mercadopago")
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: dict | None = None,
+        idempotent: bool = False,
+    ) -> dict:
+        """
+        Call a MercadoPago REST endpoint.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. "/v1/payments/123")
+            body: JSON body
+            idempotent: Whether the call may be retried after it reached MercadoPago
+
+        Returns:
+            dict with the HTTP `status` and the parsed `response` body
+
+        Raises:
+            CircuitOpenError: If MercadoPago is failing and the circuit is open
+            httpx.HTTPError: If no response was received
+        """
+        content = orjson.dumps(body) if body is not None else None
+        response = await send_with_retry(
+            self._breaker,
+            lambda: self._client.request(
+                method,
+                f"{MERCADOPAGO_API_URL}{path}",
+                content=content,
+                headers=self._headers,
+                timeout=self._config.timeout,
+            ),
+            bulkhead=self._bulkhead,
+            idempotent=idempotent,
+            attempts=1 + self._config.max_retries,
+        )
+        return {
+            "status": response.status_code,
+            "response": orjson.loads(response.content) if response.content else {},
+        }
 
     async def create_payment(
         self,
@@ -53,6 +113,8 @@ class MercadoPagoAdapter(IPaymentGateway):
         Raises:
             PaymentGatewayError: If payment creation fails
         """
+        metadata = metadata or {}
+
         try:
             preference_data = {
                 "items": [
@@ -64,16 +126,16 @@ class MercadoPagoAdapter(IPaymentGateway):
                     }
                 ],
                 "back_urls": {
-                    "success": metadata.get("success_url") if metadata else None,
-                    "failure": metadata.get("failure_url") if metadata else None,
-                    "pending": metadata.get("pending_url") if metadata else None,
+                    "success": metadata.get("success_url"),
+                    "failure": metadata.get("failure_url"),
+                    "pending": metadata.get("pending_url"),
                 },
                 "auto_return": "approved",
-                "external_reference": metadata.get("external_reference") if metadata else None,
-                "metadata": metadata or {},
+                "external_reference": metadata.get("external_reference"),
+                "metadata": metadata,
             }
 
-            result = self._sdk.preference().create(preference_data)
+            result = await self._request("POST", "/checkout/preferences", preference_data)
 
             if result["status"] != 201:
                 raise PaymentGatewayError(
@@ -105,7 +167,7 @@ class MercadoPagoAdapter(IPaymentGateway):
             PaymentGatewayError: If query fails
         """
         try:
-            result = self._sdk.payment().get(payment_id)
+            result = await self._request("GET", f"/v1/payments/{payment_id}", idempotent=True)
 
             if result["status"] != 200:
                 raise PaymentGatewayError(f"Failed to get payment status: {payment_id}")
@@ -151,7 +213,7 @@ class MercadoPagoAdapter(IPaymentGateway):
             if amount is not None:
                 refund_data["amount"] = amount
 
-            result = self._sdk.refund().create(payment_id, refund_data)
+            result = await self._request("POST", f"/v1/payments/{payment_id}/refunds", refund_data)
 
             if result["status"] not in [200, 201]:
                 raise PaymentGatewayError(f"Failed to refund payment: {payment_id}")
@@ -1,11 +1,27 @@
 """HTTP client adapter for Plex 25 API."""
 from __future__ import annotations
 
+import json
+import re
+
 import httpx
+import orjson
 
 from app.domain.exceptions import ExternalServiceError, ServiceUnavailableError
 from app.domain.interfaces.services import IPlexService
 from app.infrastructure.config import PlexConfig
+from app.infrastructure.external.http_client import get_http_client
+from app.infrastructure.external.resilience import (
+    get_bulkhead,
+    get_circuit_breaker,
+    send_with_retry,
+)
+
+# Plex puts the envelope status before the payload, so error replies can be
+# recognised from the first bytes without parsing the whole body
+_HEADER_SIZE = 512
+_RESPCODE = re.compile(rb'"respcode"\s*:\s*"?(-?\d+)"?')
+_RESPMSG = re.compile(rb'"respmsg"\s*:\s*("(?:[^"\\]|\\.)*")')
 
 
 class PlexAdapter(IPlexService):
@@ -16,18 +32,27 @@ class PlexAdapter(IPlexService):
     pattern so application code only depends on the `IPlexService` contract.
     """
 
-    def __init__(self, config: PlexConfig):
+    def __init__(self, config: PlexConfig, client: httpx.AsyncClient | None = None):
         if not config.is_configured:
             raise ValueError("Plex integration is not properly configured")
 
         self._config = config
-        self._client = httpx.AsyncClient(
-            base_url=config.sanitized_base_url,
-            auth=(config.username or "", config.password or ""),
-            timeout=config.timeout,
-            headers={"Content-Type": "application/json"},
-            verify=config.verify_ssl,
-        )
+        # Request URLs only vary by method name; build their fixed part once
+        base_url = config.sanitized_base_url
+        get_prefix = config.get_prefix.strip("/")
+        self._get_url = f"{base_url}/{get_prefix}/" if get_prefix else f"{base_url}/"
+        self._post_url = f"{base_url}/{config.post_endpoint.lstrip('/')}"
+        self._auth = httpx.BasicAuth(config.username or "", config.password or "")
+        self._headers = {"Content-Type": "application/json"}
+
+        # Certificate verification is a client-wide setting, so an adapter that
+        # disables it cannot use the shared client
+        self._owns_client = client is None and not config.verify_ssl
+        if self._owns_client:
+            client = httpx.AsyncClient(verify=False)
+        self._client = client or get_http_client()
+        self._breaker = get_circuit_breaker("plex")
+        self._bulkhead = get_bulkhead("plex")
 
     async def is_available(self) -> bool:
         """Lightweight availability check using the `usuarios` endpoint."""
@@ -44,9 +69,19 @@ class PlexAdapter(IPlexService):
     async def get(self, method: str, params: dict | None = None) -> dict:
         """Call a Plex GET endpoint."""
 
-        url = f"{self._config.get_prefix.rstrip('/')}/{method.lstrip('/')}"
+        url = self._get_url + method.lstrip("/")
         try:
-            response = await self._client.get(url, params=params or {})
+            response = await send_with_retry(
+                self._breaker,
+                lambda: self._client.get(
+                    url,
+                    params=params or {},
+                    auth=self._auth,
+                    headers=self._headers,
+                    timeout=self._config.timeout,
+                ),
+                bulkhead=self._bulkhead,
+            )
         except httpx.HTTPError as exc:  # pragma: no cover - network failure
             raise ServiceUnavailableError(str(exc))
 
@@ -57,7 +92,18 @@ class PlexAdapter(IPlexService):
 
         body = {"request": {"type": method, "content": content or {}}}
         try:
-            response = await self._client.post(self._config.post_endpoint, json=body)
+            response = await send_with_retry(
+                self._breaker,
+                lambda: self._client.post(
+                    self._post_url,
+                    json=body,
+                    auth=self._auth,
+                    headers=self._headers,
+                    timeout=self._config.timeout,
+                ),
+                bulkhead=self._bulkhead,
+                idempotent=False,
+            )
         except httpx.HTTPError as exc:  # pragma: no cover - network failure
             raise ServiceUnavailableError(str(exc))
 
@@ -130,16 +176,63 @@ class PlexAdapter(IPlexService):
         return await self.get("stock", params={"sucursal": branch_id, "pagina": page})
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP client if this adapter created it.
+
+        The shared client is closed on application shutdown instead.
+        """
+
+        if self._owns_client:
+            await self._client.aclose()
+
+    @staticmethod
+    def _load_json(content: bytes):
+        """Parse a JSON body straight from bytes.
+
+        orjson is used first; the stdlib parser only runs for documents orjson
+        rejects but `json` accepts (e.g. NaN or integers wider than 64 bits).
+        """
 
-        await self._client.aclose()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return json.loads(content)
+
+    @staticmethod
+    def _check_header(body: bytes) -> None:
+        """Fail fast on an error respcode found in the envelope header.
+
+        Only a respcode seen before any `content` key is trusted; anything
+        else is left to the full parse in `_parse_response`.
+        """
+
+        header = body[:_HEADER_SIZE]
+        match = _RESPCODE.search(header)
+        if match is None or match.group(1) == b"0":
+            return
+
+        content_pos = header.find(b'"content"')
+        if content_pos != -1 and content_pos < match.start():
+            return
+
+        message = _RESPMSG.search(header)
+        if message is None:
+            return
+        raise ExternalServiceError(
+            json.loads(message.group(1)) or f"Error code {match.group(1).decode()}"
+        )
 
     def _parse_response(self, response: httpx.Response, method: str) -> dict:
         """Validate HTTP status and Plex response envelope."""
 
         try:
             response.raise_for_status()
-            payload = response.json()
+        except Exception as exc:  # pragma: no cover - httpx already validated
+            raise ServiceUnavailableError(f"Invalid response from Plex: {exc}")
+
+        self._check_header(response.content)
+
+        try:
+            payload = self._load_json(response.content)
         except Exception as exc:  # pragma: no cover - httpx already validated
             raise ServiceUnavailableError(f"Invalid response from Plex: {exc}")
 
@@ -0,0 +1,212 @@
+"""Circuit breaking, retries and concurrency limits for external service calls."""
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable
+
+import httpx
+
+from app.domain.exceptions import ServiceUnavailableError
+
+# Upstream is overloaded or failing; the request can be retried later
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Replies that guarantee the request was not processed, safe to retry even
+# for non-idempotent calls
+UNPROCESSED_STATUS_CODES = frozenset({429, 503})
+# Errors raised before the request reached the upstream
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """Raised when a call is rejected because its circuit is open."""
+
+    pass
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single external service.
+
+    CLOSED: calls go through; consecutive failures are counted.
+    OPEN: after `failure_threshold` consecutive failures, calls fail fast
+        with CircuitOpenError for `recovery_timeout` seconds.
+    HALF_OPEN: after the timeout, calls are let through again; the first
+        success closes the circuit, the first failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from OPEN to HALF_OPEN once the timeout elapsed."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check that a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if self.state == self.OPEN:
+            raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        self._state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when the threshold is reached."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        """Get the breaker state for health reporting."""
+        return {"state": self.state, "failures": self._failures}
+
+
+class BulkheadFullError(ServiceUnavailableError):
+    """Raised when a call is shed because too many calls are already waiting."""
+
+    pass
+
+
+class Bulkhead:
+    """
+    Concurrency limit for a single external service.
+
+    At most `max_concurrent` calls run at once; up to `max_waiting` more wait
+    for a slot, and any call beyond that is rejected immediately with
+    BulkheadFullError instead of queueing until it times out.
+    """
+
+    def __init__(self, name: str, max_concurrent: int = 50, max_waiting: int = 200):
+        self.name = name
+        self.max_waiting = max_waiting
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+
+    async def __aenter__(self) -> "Bulkhead":
+        if self._semaphore.locked():
+            if self._waiting >= self.max_waiting:
+                raise BulkheadFullError(f"{self.name} is overloaded, too many pending calls")
+            self._waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_bulkheads: dict[str, Bulkhead] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker for a service, creating it on first use.
+
+    Breakers are shared by name so adapters created per request still see
+    the same failure history.
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def get_bulkhead(name: str) -> Bulkhead:
+    """Get the process-wide bulkhead for a service, creating it on first use."""
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is None:
+        bulkhead = _bulkheads[name] = Bulkhead(name)
+    return bulkhead
+
+
+def circuit_breaker_states() -> dict[str, dict]:
+    """Get the state of every circuit breaker created so far."""
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
+
+
+async def send_with_retry(
+    breaker: CircuitBreaker,
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    bulkhead: Bulkhead | None = None,
+    idempotent: bool = True,
+    attempts: int = 3,
+    base_delay: float = 0.1,
+    max_delay: float = 2.0,
+) -> httpx.Response:
+    """
+    Send an HTTP request through a circuit breaker, retrying transient failures.
+
+    Retries use exponential backoff with full jitter. Idempotent requests are
+    retried on transport errors and 429/5xx replies; non-idempotent ones only
+    when the request was never sent or the upstream refused it (429/503).
+    Other replies, including 401/403, are returned without retrying. With a
+    bulkhead, each attempt holds a slot only while its request is in flight.
+
+    Args:
+        breaker: Circuit breaker of the target service
+        send: Coroutine function performing the request
+        bulkhead: Concurrency limit of the target service
+        idempotent: Whether repeating the request is safe
+        attempts: Maximum number of attempts
+        base_delay: Backoff base in seconds
+        max_delay: Backoff cap in seconds
+
+    Returns:
+        The last response received
+
+    Raises:
+        CircuitOpenError: If the circuit is open
+        BulkheadFullError: If too many calls are already waiting
+        httpx.HTTPError: If the last attempt failed without a response
+    """
+    retry_errors = httpx.TransportError if idempotent else UNSENT_ERRORS
+    retry_statuses = RETRYABLE_STATUS_CODES if idempotent else UNPROCESSED_STATUS_CODES
+
+    for attempt in range(1, attempts + 1):
+        breaker.before_call()
+        try:
+            if bulkhead is None:
+                response = await send()
+            else:
+                async with bulkhead:
+                    response = await send()
+        except httpx.TransportError as exc:
+            breaker.record_failure()
+            if attempt == attempts or not isinstance(exc, retry_errors):
+                raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt == attempts or response.status_code not in retry_statuses:
+                return response
+
+        await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))))
+
+    raise AssertionError("unreachable")  # pragma: no cover
@@ -4,6 +4,12 @@ import httpx
 from app.domain.interfaces.services import INotificationService
 from app.domain.exceptions import ServiceUnavailableError
 from app.infrastructure.config import WhatsAppConfig
+from app.infrastructure.external.http_client import get_http_client
+from app.infrastructure.external.resilience import (
+    get_bulkhead,
+    get_circuit_breaker,
+    send_with_retry,
+)
 
 
 class ChattigoAdapter(INotificationService):
@@ -17,19 +23,20 @@ class ChattigoAdapter(INotificationService):
     our domain interface and the Chattigo API.
     """
 
-    def __init__(self, config: WhatsAppConfig):
+    def __init__(self, config: WhatsAppConfig, client: httpx.AsyncClient | None = None):
         """
         Initialize Chattigo adapter.
 
         Args:
             config: WhatsApp configuration
+            client: HTTP client to use (defaults to the shared client)
         """
         self._config = config
-        self._client = httpx.AsyncClient(
-            base_url=config.api_url,
-            headers={"Authorization": f"Bearer {config.auth_token}"},
-            timeout=config.timeout
-        )
+        self._base_url = config.api_url.rstrip("/")
+        self._headers = {"Authorization": f"Bearer {config.auth_token}"}
+        self._client = client or get_http_client()
+        self._breaker = get_circuit_breaker("chattigo")
+        self._bulkhead = get_bulkhead("chattigo")
 
     async def send_message(
         self,
@@ -55,13 +62,20 @@ class ChattigoAdapter(INotificationService):
             raise ServiceUnavailableError("WhatsApp service not configured")
 
         try:
-            response = await self._client.post(
-                "/messages",
-                json={
-                    "phone": recipient,
-                    "body": message,
-                    "from": self._config.whatsapp_number,
-                }
+            response = await send_with_retry(
+                self._breaker,
+                lambda: self._client.post(
+                    f"{self._base_url}/messages",
+                    headers=self._headers,
+                    timeout=self._config.timeout,
+                    json={
+                        "phone": recipient,
+                        "body": message,
+                        "from": self._config.whatsapp_number,
+                    },
+                ),
+                bulkhead=self._bulkhead,
+                idempotent=False,
             )
             response.raise_for_status()
             return True
@@ -92,14 +106,21 @@ class ChattigoAdapter(INotificationService):
             raise ServiceUnavailableError("WhatsApp service not configured")
 
         try:
-            response = await self._client.post(
-                "/templates",
-                json={
-                    "phone": recipient,
-                    "template": template_id,
-                    "params": parameters,
-                    "from": self._config.whatsapp_number,
-                }
+            response = await send_with_retry(
+                self._breaker,
+                lambda: self._client.post(
+                    f"{self._base_url}/templates",
+                    headers=self._headers,
+                    timeout=self._config.timeout,
+                    json={
+                        "phone": recipient,
+                        "template": template_id,
+                        "params": parameters,
+                        "from": self._config.whatsapp_number,
+                    },
+                ),
+                bulkhead=self._bulkhead,
+                idempotent=False,
             )
             response.raise_for_status()
             return True
@@ -108,5 +129,4 @@ class ChattigoAdapter(INotificationService):
             raise ServiceUnavailableError(f"Failed to send template message: {str(e)}")
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self._client.aclose()
+        """Release the adapter (the shared HTTP client is closed on application shutdown)."""
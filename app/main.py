@@ -1,21 +1,63 @@
 """
 WhatsApp Pharmacy Assistant - Main FastAPI Application
 """
+import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from app.core.config import settings
+from app.db.session import engine
 from app.api.v1 import api_router
-from app.middleware.auth_middleware import AuthMiddleware
 from app.middleware.error_handler import error_handler_middleware
+from app.middleware.token_usage import token_usage_tracker
+from app.presentation.api.exception_handlers import register_exception_handlers
+from app.infrastructure.dependencies.database import close_clients
+from app.infrastructure.external.http_client import close_http_client, get_http_client
+
+logger = logging.getLogger(__name__)
 
 # Set timezone
 os.environ["TZ"] = getattr(settings, "timezone", "America/Argentina/Buenos_Aires")
 time.tzset()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up shared resources on startup and release them on shutdown."""
+    logger.info("%s starting (environment: %s)", settings.APP_NAME, settings.ENVIRONMENT)
+    logger.info(
+        "Database: %s",
+        settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "configured",
+    )
+    logger.info("WhatsApp: %s", "configured" if settings.CHATTIGO_AUTH_TOKEN else "not configured")
+    logger.info("Mercado Pago: %s", "configured" if settings.MERCADOPAGO_ACCESS_TOKEN else "not configured")
+
+    # Open the shared HTTP client and a first pooled database connection now,
+    # so the first request does not pay for them
+    get_http_client()
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception:
+        logger.warning("Database warm-up failed; connections will be opened on demand", exc_info=True)
+
+    token_usage_tracker.start()
+    logger.info("Application ready")
+
+    yield
+
+    logger.info("%s shutting down", settings.APP_NAME)
+    await token_usage_tracker.stop()
+    await close_clients()
+    await close_http_client()
+    await engine.dispose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
@@ -24,12 +66,21 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Store settings in app state
 app.state.settings = settings
 
-# CORS middleware
+# Domain errors raised by routes are mapped to 4xx responses
+register_exception_handlers(app)
+
+# Error handler middleware
+app.middleware("http")(error_handler_middleware)
+
+# CORS middleware (added last so it is outermost: preflight requests are
+# answered before any other middleware runs, and error responses get CORS headers)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -38,13 +89,6 @@ app.add_middleware(
     allow_headers=settings.ALLOWED_HEADERS,
 )
 
-# Error handler middleware
-app.middleware("http")(error_handler_middleware)
-
-# Authentication middleware
-auth_middleware = AuthMiddleware()
-app.middleware("http")(auth_middleware)
-
 # Include API v1 router
 app.include_router(api_router)
 
@@ -70,20 +114,3 @@ async def root():
             "payments": "/api/v1/payments",
         },
     }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler."""
-    print(f"🚀 {settings.APP_NAME} starting...")
-    print(f"📍 Environment: {settings.ENVIRONMENT}")
-    print(f"🔗 Database: {settings.DATABASE_URL.split('@')[-1] if '@' in settings.DATABASE_URL else 'configured'}")
-    print(f"📱 WhatsApp: {'configured' if settings.CHATTIGO_AUTH_TOKEN else 'not configured'}")
-    print(f"💰 Mercado Pago: {'configured' if settings.MERCADOPAGO_ACCESS_TOKEN else 'not configured'}")
-    print(f"✅ Application ready!")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event handler."""
-    print(f"🛑 {settings.APP_NAME} shutting down...")
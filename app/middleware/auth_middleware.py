@@ -1,173 +1,260 @@
 """
-Authentication middleware for API token validation.
+Authentication dependencies for API token validation.
 """
-from fastapi import Request, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from contextvars import ContextVar
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+from types import MappingProxyType
+from typing import Awaitable, Callable, ClassVar
 import hashlib
+import time
 
 from app.db.session import async_session
 from app.models.access_token import AccessToken
 from app.models.pharmacy import Pharmacy
+from app.middleware.token_usage import token_usage_tracker
 
 
-security = HTTPBearer(auto_error=False)
-
-
-class AuthMiddleware:
+class RawHTTPBearer(HTTPBearer):
     """
-    Middleware for authenticating API requests using Bearer tokens.
+    Bearer scheme that returns the token as the raw header bytes.
 
-    Flow:
-    1. Extract Bearer token from Authorization header
-    2. Hash token with SHA-256
-    3. Lookup token in database
-    4. Validate token (active, not expired, etc.)
-    5. Attach pharmacy context to request
-    6. Track token usage
+    Documented in OpenAPI like HTTPBearer, but reads the ASGI header list
+    directly so the token is hashed without being decoded to `str` and
+    re-encoded.
     """
 
-    def __init__(self):
-        # Public endpoints that don't require authentication
-        self.public_paths = [
-            "/",
-            "/health",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/api/v1/webhook/whatsapp",  # WhatsApp webhook (validated separately)
-            "/api/v1/payments/webhook",  # Mercado Pago webhook (validated separately)
-        ]
-
-    async def __call__(self, request: Request, call_next):
-        """Process the request with authentication."""
-        # Check if path is public
-        if self._is_public_path(request.url.path):
-            return await call_next(request)
-
-        # Extract token from header
-        token = await self._extract_token(request)
-        if not token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Missing authentication token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    async def __call__(self, request: Request) -> bytes | None:  # type: ignore[override]
+        # ASGI header names are lower-cased bytes
+        for name, value in request.scope["headers"]:
+            if name == b"authorization":
+                if value[:7].lower() == b"bearer ":
+                    return value[7:] or None
+                return None
+        return None
 
-        # Validate token and get pharmacy context
-        async with async_session() as db:
-            token_data = await self._validate_token(db, token)
-            if not token_data:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired token",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            # Attach pharmacy and token context to request
-            request.state.pharmacy_id = token_data["pharmacy_id"]
-            request.state.pharmacy = token_data["pharmacy"]
-            request.state.token_id = token_data["token_id"]
-            request.state.token_role = token_data["role"]
-            request.state.token_scopes = token_data["scopes"]
-
-            # Track token usage (fire and forget)
-            await self._track_token_usage(db, token_data["token_id"])
-
-        # Continue with request
-        response = await call_next(request)
-        return response
-
-    def _is_public_path(self, path: str) -> bool:
-        """Check if path is public (doesn't require authentication)."""
-        return any(path.startswith(public) for public in self.public_paths)
-
-    async def _extract_token(self, request: Request) -> str | None:
-        """Extract Bearer token from Authorization header."""
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            return None
 
-        if not auth_header.startswith("Bearer "):
-            return None
+security = RawHTTPBearer(auto_error=False, scheme_name="HTTPBearer")
+
+# Validated tokens are cached per process for at most this many seconds, which
+# bounds how long a revoked token stays usable in other worker processes
+TOKEN_CACHE_TTL = 60.0
+TOKEN_CACHE_MAXSIZE = 4096
+
+_sha256 = hashlib.sha256
+
+# Active, unexpired token with its pharmacy; built and compiled once. Both
+# are read as plain columns (the token ones are all held by
+# ix_access_tokens_lookup), so no ORM instance is built or tracked
+_FIND_ACTIVE_TOKEN = lambda_stmt(
+    lambda: select(
+        AccessToken.id,
+        AccessToken.role,
+        AccessToken.scopes,
+        AccessToken.expires_at,
+        Pharmacy.id,
+        Pharmacy.name,
+        Pharmacy.status,
+    )
+    .join(Pharmacy, AccessToken.pharmacy_id == Pharmacy.id)
+    .where(AccessToken.token_hash == bindparam("token_hash"))
+    .where(AccessToken.is_active == True)
+    .where(~AccessToken.is_expired)
+)
+
+# Role hierarchy: a token may use endpoints requiring its own level or lower
+_ROLE_LEVELS = MappingProxyType({
+    "admin": 4,
+    "manager": 3,
+    "readonly": 2,
+    "limited": 1,
+})
+
+
+@dataclass(frozen=True, slots=True)
+class PharmacySnapshot:
+    """Immutable copy of the authenticated pharmacy's fields, safe to share between requests."""
+
+    id: UUID
+    name: str
+    status: str
+
+
+@dataclass(frozen=True, slots=True)
+class TokenContext:
+    """Validated token context attached to authenticated requests."""
+
+    pharmacy_id: UUID
+    pharmacy: PharmacySnapshot
+    token_id: UUID
+    role: str
+    scopes: tuple[str, ...]
+
+
+class TokenAuthenticator:
+    """
+    Authenticates API requests using Bearer tokens.
 
-        return auth_header[7:]  # Remove "Bearer " prefix
+    Flow:
+    1. Hash token with SHA-256
+    2. Lookup token in database
+    3. Validate token (active, not expired, etc.)
+    4. Return the pharmacy and token context
 
-    async def _validate_token(self, db: AsyncSession, token: str) -> dict | None:
+    Validated tokens are cached in-process by token hash, so repeated
+    requests with the same token skip the lookup query.
+    """
+
+    # SHA-256 digest -> (monotonic expiry, context), shared by all instances
+    _token_cache: ClassVar[dict[bytes, tuple[float, TokenContext]]] = {}
+
+    async def validate_token(self, token: bytes) -> TokenContext | None:
         """
         Validate token and return pharmacy context.
 
+        A database session is only opened when the token is not cached.
+
         Returns:
-            dict with pharmacy_id, pharmacy, token_id, role, scopes
+            TokenContext with pharmacy_id, pharmacy, token_id, role, scopes
             None if token is invalid
         """
         # Hash token with SHA-256
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        digest = _sha256(token).digest()
+
+        cached = self._token_cache.get(digest)
+        if cached is not None:
+            expires_at, token_data = cached
+            if time.monotonic() < expires_at:
+                return token_data
+            self._token_cache.pop(digest, None)
+
+        async with async_session() as db:
+            return await self._load_token(db, digest)
+
+    async def _load_token(self, db: AsyncSession, digest: bytes) -> TokenContext | None:
+        """Look up and validate a token in the database, caching it if valid."""
+        # Read-only lookup: autocommit skips the BEGIN/ROLLBACK round-trips
+        await db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
 
         # Lookup token in database with pharmacy relationship
-        result = await db.execute(
-            select(AccessToken, Pharmacy)
-            .join(Pharmacy, AccessToken.pharmacy_id == Pharmacy.id)
-            .where(AccessToken.token_hash == token_hash)
-            .where(AccessToken.is_active == True)
-        )
+        result = await db.execute(_FIND_ACTIVE_TOKEN, {"token_hash": digest.hex()})
         row = result.first()
 
         if not row:
             return None
 
-        access_token, pharmacy = row
-
-        # Check if token is expired
-        if access_token.is_expired:
-            return None
+        token_id, role, scopes, token_expires_at, pharmacy_id, pharmacy_name, pharmacy_status = row
 
         # Check if pharmacy is active
-        if pharmacy.status != "active":
+        if pharmacy_status != "active":
             return None
 
-        return {
-            "pharmacy_id": pharmacy.id,
-            "pharmacy": pharmacy,
-            "token_id": access_token.id,
-            "role": access_token.role,
-            "scopes": access_token.scopes,
-        }
+        token_data = TokenContext(
+            pharmacy_id=pharmacy_id,
+            pharmacy=PharmacySnapshot(id=pharmacy_id, name=pharmacy_name, status=pharmacy_status),
+            token_id=token_id,
+            role=role,
+            scopes=tuple(scopes),
+        )
+        self._cache_token(digest, token_data, token_expires_at)
+        return token_data
+
+    @classmethod
+    def _cache_token(
+        cls,
+        digest: bytes,
+        token_data: TokenContext,
+        token_expires_at: datetime | None,
+    ) -> None:
+        """Cache a validated token, never past the token's own expiry."""
+        ttl = TOKEN_CACHE_TTL
+        if token_expires_at is not None:
+            now = datetime.now(timezone.utc) if token_expires_at.tzinfo else datetime.utcnow()
+            ttl = min(ttl, (token_expires_at - now).total_seconds())
+            if ttl <= 0:
+                return
+
+        cache = cls._token_cache
+        if digest not in cache and len(cache) >= TOKEN_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        cache[digest] = (time.monotonic() + ttl, token_data)
+
+    @classmethod
+    def invalidate_token(cls, token_hash: str) -> None:
+        """Drop a token, given its stored hex hash, from this process's cache (e.g. after revocation)."""
+        cls._token_cache.pop(bytes.fromhex(token_hash), None)
+
+    @classmethod
+    def clear_token_cache(cls) -> None:
+        """Drop all cached tokens."""
+        cls._token_cache.clear()
+
+
+authenticator = TokenAuthenticator()
+
+# Context of the authenticated token for the current request
+_current_token: ContextVar[TokenContext | None] = ContextVar("current_token", default=None)
+
+
+async def verify_bearer(token: bytes | None = Depends(security)) -> TokenContext:
+    """
+    Dependency that authenticates the request's Bearer token.
 
-    async def _track_token_usage(self, db: AsyncSession, token_id: str):
-        """Track token usage (increment counter, update last_used_at)."""
-        from datetime import datetime
+    Attach it to protected routers; FastAPI resolves it once per request
+    even when several dependencies require it.
 
-        result = await db.execute(
-            select(AccessToken).where(AccessToken.id == token_id)
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or expired
+    """
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing authentication token",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        token = result.scalar_one_or_none()
 
-        if token:
-            token.usage_count += 1
-            token.last_used_at = datetime.utcnow()
-            await db.commit()
+    token_data = await authenticator.validate_token(token)
+    if not token_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    _current_token.set(token_data)
+
+    # Track token usage (written in batches)
+    token_usage_tracker.record(token_data.token_id)
+    return token_data
+
+
+def get_token_context() -> TokenContext | None:
+    """Get the authenticated token context of the current request, if any."""
+    return _current_token.get()
 
 
-async def get_current_pharmacy(request: Request) -> Pharmacy:
+async def get_current_pharmacy(token: TokenContext = Depends(verify_bearer)) -> PharmacySnapshot:
     """
     Dependency to get current pharmacy from request context.
 
+    Returns a read-only snapshot (id, name, status), not an ORM instance;
+    query the pharmacy when more fields are needed.
+
     Usage:
         @app.get("/api/v1/clients")
-        async def get_clients(pharmacy: Pharmacy = Depends(get_current_pharmacy)):
+        async def get_clients(pharmacy: PharmacySnapshot = Depends(get_current_pharmacy)):
             print(f"Pharmacy: {pharmacy.name}")
     """
-    if not hasattr(request.state, "pharmacy"):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required"
-        )
-    return request.state.pharmacy
+    return token.pharmacy
 
 
-async def get_current_pharmacy_id(request: Request) -> str:
+async def get_current_pharmacy_id(token: TokenContext = Depends(verify_bearer)) -> UUID:
     """
     Dependency to get current pharmacy ID from request context.
 
@@ -176,15 +263,10 @@ async def get_current_pharmacy_id(request: Request) -> str:
         async def get_clients(pharmacy_id: str = Depends(get_current_pharmacy_id)):
             print(f"Pharmacy ID: {pharmacy_id}")
     """
-    if not hasattr(request.state, "pharmacy_id"):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required"
-        )
-    return request.state.pharmacy_id
+    return token.pharmacy_id
 
 
-def require_role(required_role: str):
+def require_role(required_role: str) -> Callable[..., Awaitable[None]]:
     """
     Dependency to require specific role.
 
@@ -196,24 +278,10 @@ def require_role(required_role: str):
         ):
             # Only admins can access this
     """
-    async def check_role(request: Request):
-        if not hasattr(request.state, "token_role"):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authentication required"
-            )
-
-        role_hierarchy = {
-            "admin": 4,
-            "manager": 3,
-            "readonly": 2,
-            "limited": 1,
-        }
-
-        user_role_level = role_hierarchy.get(request.state.token_role, 0)
-        required_role_level = role_hierarchy.get(required_role, 999)
+    required_role_level = _ROLE_LEVELS.get(required_role, 999)
 
-        if user_role_level < required_role_level:
+    async def check_role(token: TokenContext = Depends(verify_bearer)) -> None:
+        if _ROLE_LEVELS.get(token.role, 0) < required_role_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required role: {required_role}"
@@ -1,17 +1,26 @@
 """
 Global error handler middleware.
 """
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from pydantic import ValidationError
+from typing import Awaitable, Callable
 import logging
-import traceback
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Settings do not change at runtime; read the flag once instead of going
+# through request.app.state on every error
+_DEBUG = settings.DEBUG
+
 
-async def error_handler_middleware(request: Request, call_next):
+async def error_handler_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
     """
     Global error handler middleware for consistent error responses.
 
@@ -23,8 +32,8 @@ async def error_handler_middleware(request: Request, call_next):
 
     except ValidationError as e:
         # Pydantic validation errors
-        logger.warning(f"Validation error: {e}")
-        return JSONResponse(
+        logger.warning("Validation error: %s", e)
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "validation_error",
@@ -35,8 +44,8 @@ async def error_handler_middleware(request: Request, call_next):
 
     except IntegrityError as e:
         # Database integrity errors (unique constraints, foreign keys, etc.)
-        logger.error(f"Database integrity error: {e}")
-        return JSONResponse(
+        logger.error("Database integrity error: %s", e)
+        return ORJSONResponse(
             status_code=status.HTTP_409_CONFLICT,
             content={
                 "error": "integrity_error",
@@ -47,24 +56,24 @@ async def error_handler_middleware(request: Request, call_next):
 
     except SQLAlchemyError as e:
         # Other database errors
-        logger.error(f"Database error: {e}")
-        return JSONResponse(
+        logger.error("Database error: %s", e)
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "database_error",
                 "message": "Database operation failed",
-                "details": str(e) if request.app.state.settings.DEBUG else "Internal server error",
+                "details": str(e) if _DEBUG else "Internal server error",
             }
         )
 
     except Exception as e:
-        # Unexpected errors
-        logger.error(f"Unexpected error: {e}\n{traceback.format_exc()}")
-        return JSONResponse(
+        # Unexpected errors (the traceback is only formatted if the record is emitted)
+        logger.exception("Unexpected error: %s", e)
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "internal_server_error",
                 "message": "An unexpected error occurred",
-                "details": str(e) if request.app.state.settings.DEBUG else "Internal server error",
+                "details": str(e) if _DEBUG else "Internal server error",
             }
         )
@@ -0,0 +1,139 @@
+"""
+Batched access token usage tracking.
+"""
+from sqlalchemy import update, bindparam, func
+from datetime import datetime, timezone
+from uuid import UUID
+import asyncio
+import logging
+
+from app.db.session import async_session
+from app.models.access_token import AccessToken
+
+logger = logging.getLogger(__name__)
+
+_tokens = AccessToken.__table__
+
+# One statement executed with a parameter set per token (executemany). Every
+# worker process flushes its own batch, so last_used_at only moves forward
+# (GREATEST ignores NULL)
+_INCREMENT_USAGE = (
+    update(_tokens)
+    .where(_tokens.c.id == bindparam("b_token_id"))
+    .values(
+        usage_count=_tokens.c.usage_count + bindparam("b_uses"),
+        last_used_at=func.greatest(_tokens.c.last_used_at, bindparam("b_last_used_at")),
+    )
+)
+
+
+class TokenUsageTracker:
+    """
+    Accumulates token usage in memory and writes it in batches.
+
+    Recording a use only updates in-process counters. A background task
+    flushes them every `interval` seconds, or earlier once `max_pending`
+    uses are pending, as a single atomic increment per token.
+
+    The task's event and lock are created by `start()` and dropped by
+    `stop()`, so the tracker can be started again on another event loop
+    (e.g. a second application lifespan in the same process).
+    """
+
+    def __init__(self, interval: float = 5.0, max_pending: int = 100):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._uses: dict[UUID, int] = {}
+        self._last_used: dict[UUID, datetime] = {}
+        self._pending = 0
+        self._flush_requested: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._task: asyncio.Task | None = None
+
+    def record(self, token_id: UUID) -> None:
+        """Record one use of a token."""
+        self._uses[token_id] = self._uses.get(token_id, 0) + 1
+        self._last_used[token_id] = datetime.now(timezone.utc)
+        self._pending += 1
+        if self._pending >= self.max_pending and self._flush_requested is not None:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        """Write pending usage to the database."""
+        if self._flush_lock is None:
+            # Not started: no background flush can run concurrently
+            await self._write_pending()
+            return
+        async with self._flush_lock:
+            await self._write_pending()
+
+    async def _write_pending(self) -> None:
+        """Write and clear the pending usage, keeping it if the write fails."""
+        if not self._uses:
+            return
+
+        # Swap the buffers so uses recorded during the write go to the next batch
+        uses, last_used = self._uses, self._last_used
+        self._uses, self._last_used = {}, {}
+        self._pending = 0
+
+        try:
+            async with async_session() as db:
+                await db.execute(
+                    _INCREMENT_USAGE,
+                    [
+                        {
+                            "b_token_id": token_id,
+                            "b_uses": count,
+                            "b_last_used_at": last_used[token_id],
+                        }
+                        for token_id, count in uses.items()
+                    ],
+                )
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to write token usage for %d tokens", len(uses))
+            # Keep the counts for the next flush
+            for token_id, count in uses.items():
+                self._uses[token_id] = self._uses.get(token_id, 0) + count
+                self._pending += count
+                if token_id not in self._last_used:
+                    self._last_used[token_id] = last_used[token_id]
+
+    async def _run(self, flush_requested: asyncio.Event) -> None:
+        """Flush periodically, or as soon as enough uses are pending."""
+        while True:
+            try:
+                await asyncio.wait_for(flush_requested.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            flush_requested.clear()
+            # Shielded so stop() cannot interrupt a write half-way
+            await asyncio.shield(self.flush())
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._task is None:
+            # Created here rather than in __init__: asyncio primitives bind to
+            # the loop that first waits on them
+            self._flush_requested = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            if self._pending >= self.max_pending:
+                self._flush_requested.set()
+            self._task = asyncio.get_running_loop().create_task(self._run(self._flush_requested))
+
+    async def stop(self) -> None:
+        """Stop the background flush task and write any pending usage."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        self._flush_requested = None
+        self._flush_lock = None
+
+
+token_usage_tracker = TokenUsageTracker()
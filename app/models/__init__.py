@@ -1,5 +1,14 @@
 """
 Database models for WhatsApp Pharmacy Assistant.
+
+JSONB columns (tags, scopes, items) are indexed with GIN jsonb_path_ops,
+which only accelerates top-level containment. Filter them with `@>`:
+
+- element of a list: `Client.tags.contains(["vip"])`
+- key/value in an object list: `Transaction.items.contains([{"name": name}])`
+
+Arrow extraction (`column["key"]`, `->`/`->>`) cannot use those indexes;
+keep it for range comparisons, LIKE patterns and sorting.
 """
 # Import Base first
 from app.db.base import Base
@@ -8,6 +17,7 @@ from app.db.base import Base
 from app.models.pharmacy import Pharmacy
 from app.models.access_token import AccessToken
 from app.models.client import Client
+from app.models.pharmacy_client_counter import PharmacyClientCounter
 from app.models.transaction import Transaction
 from app.models.invoice import Invoice
 from app.models.audit_log import AuditLog
@@ -18,6 +28,7 @@ __all__ = [
     "Pharmacy",
     "AccessToken",
     "Client",
+    "PharmacyClientCounter",
     "Transaction",
     "Invoice",
     "AuditLog",
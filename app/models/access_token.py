@@ -1,10 +1,11 @@
 """
 Access Token model - API Authentication tokens with role-based access control.
 """
-from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, CheckConstraint
+from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, ColumnElement, Enum, Index, and_, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID as UUID_Type
 import uuid as uuid_module
 
@@ -37,15 +38,15 @@ class AccessToken(Base):
     token_name: Mapped[str | None] = mapped_column(String(100), nullable=True)  # Human-readable name
 
     # Permissions & Scope
-    role: Mapped[str] = mapped_column(String(50), nullable=False)  # admin, manager, readonly, limited
-    scopes: Mapped[List] = mapped_column(JSONB, default=[], nullable=False)  # ["clients:read", "transactions:write", etc.]
+    role: Mapped[str] = mapped_column(Enum("admin", "manager", "readonly", "limited", name="token_role"), nullable=False)
+    scopes: Mapped[list[str]] = mapped_column(JSONB, default=list, nullable=False)  # ["clients:read", "transactions:write", etc.]
 
     # Rate Limiting
     rate_limit_per_minute: Mapped[int] = mapped_column(Integer, default=60, nullable=False)
     rate_limit_per_day: Mapped[int] = mapped_column(Integer, default=10000, nullable=False)
 
     # IP Restrictions (optional - empty array means all IPs allowed)
-    allowed_ips: Mapped[List] = mapped_column(JSONB, default=[], nullable=False)
+    allowed_ips: Mapped[list[str]] = mapped_column(JSONB, default=list, nullable=False)
 
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -54,29 +55,45 @@ class AccessToken(Base):
     usage_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_by: Mapped[UUID_Type | None] = mapped_column(UUID(as_uuid=True), nullable=True)  # User/admin who created it
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     revoked_by: Mapped[UUID_Type | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     # Extra metadata (flexible JSON storage)
-    extra_metadata: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
+    extra_metadata: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
 
     # Relationships
     pharmacy = relationship("Pharmacy", back_populates="access_tokens")
-    audit_logs = relationship("AuditLog", foreign_keys="[AuditLog.token_id]", back_populates="token")
+    audit_logs = relationship("AuditLog", foreign_keys="[AuditLog.token_id]", back_populates="token", lazy="raise_on_sql", passive_deletes=True)
 
     # Constraints
     __table_args__ = (
-        CheckConstraint(role.in_(["admin", "manager", "readonly", "limited"]), name="chk_token_role"),
+        # Covers the authentication lookup so it can be an index-only scan
+        Index(
+            "ix_access_tokens_lookup",
+            "token_hash",
+            postgresql_include=["id", "pharmacy_id", "role", "scopes", "expires_at"],
+            postgresql_where=is_active,
+        ),
+        # Scope lookups use JSONB containment (scopes @> '["clients:read"]')
+        Index("ix_access_tokens_scopes", "scopes", postgresql_using="gin", postgresql_ops={"scopes": "jsonb_path_ops"}),
     )
 
     def __repr__(self):
         return f"<AccessToken(id={self.id}, pharmacy_id={self.pharmacy_id}, role='{self.role}', active={self.is_active})>"
 
-    @property
+    @hybrid_property
     def is_expired(self) -> bool:
         """Check if token has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        # Timezone-aware when loaded from PostgreSQL
+        now = datetime.now(timezone.utc) if self.expires_at.tzinfo else datetime.utcnow()
+        return now > self.expires_at
+
+    @is_expired.inplace.expression
+    @classmethod
+    def _is_expired_expression(cls) -> ColumnElement[bool]:
+        """SQL form of `is_expired`, evaluated with the database clock."""
+        return and_(cls.expires_at.is_not(None), cls.expires_at <= func.now())
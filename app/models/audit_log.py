@@ -1,14 +1,14 @@
 """
 Audit Log model - Security, compliance, and activity tracking.
 """
-from sqlalchemy import String, DateTime, ForeignKey, Text
+from sqlalchemy import String, DateTime, ForeignKey, Text, event, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB, INET
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID as UUID_Type
-import uuid as uuid_module
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class AuditLog(Base):
@@ -21,12 +21,16 @@ class AuditLog(Base):
     - Change tracking (before/after values)
     - Request metadata (IP, user agent, etc.)
     - Security and compliance auditing
+
+    On PostgreSQL the table is range-partitioned by month of `created_at`,
+    so date-bounded queries only scan the matching partitions and old
+    months are dropped as whole partitions instead of deleted row by row.
     """
 
     __tablename__: str = "audit_logs"  # type: ignore[assignment]
 
     # Primary Key
-    id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid_module.uuid4)
+    id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)  # Time-ordered: append-heavy table
 
     # Foreign Key to Pharmacy (optional - some events may not have pharmacy context)
     pharmacy_id: Mapped[UUID_Type | None] = mapped_column(UUID(as_uuid=True), ForeignKey("pharmacies.id", ondelete="CASCADE"), nullable=True, index=True)
@@ -49,15 +53,57 @@ class AuditLog(Base):
     old_values: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # Snapshot before change
     new_values: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # Snapshot after change
 
-    # Timestamp
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    # Timestamp (partition key, so part of the primary key)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False, index=True)
 
     # Extra metadata (flexible JSON storage)
-    extra_metadata: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
+    extra_metadata: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
 
     # Relationships
     pharmacy = relationship("Pharmacy", back_populates="audit_logs")
     token = relationship("AccessToken", foreign_keys=[token_id], back_populates="audit_logs")
 
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
+
     def __repr__(self):
         return f"<AuditLog(id={self.id}, event='{self.event_type}', entity='{self.entity_type}', actor='{self.actor_type}')>"
+
+
+def _add_months(month: date, months: int) -> date:
+    """Get the first day of the month `months` after `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_audit_log_partitions(connection: Connection, start: date | None = None, months_ahead: int = 1) -> None:
+    """
+    Create the monthly audit_logs partitions from `start` through `months_ahead` months later.
+
+    Idempotent. Run it from a scheduled job (or `AsyncConnection.run_sync`)
+    before each month begins: rows for a month without its own partition go
+    to audit_logs_default, and that month's partition cannot be created
+    while they are there. Retention drops old partitions
+    (`DROP TABLE audit_logs_YYYY_MM`).
+
+    Args:
+        connection: PostgreSQL connection
+        start: Any day of the first month (default: current month)
+        months_ahead: Number of following months to create
+    """
+    first_month = (start or date.today()).replace(day=1)
+    for offset in range(months_ahead + 1):
+        lower = _add_months(first_month, offset)
+        upper = _add_months(lower, 1)
+        connection.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS audit_logs_{lower:%Y_%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+
+
+@event.listens_for(AuditLog.__table__, "after_create")
+def _create_initial_partitions(target, connection: Connection, **kw) -> None:
+    """Create the default partition and the current and next month's partitions."""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.exec_driver_sql("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT")
+    create_audit_log_partitions(connection)
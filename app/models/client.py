@@ -1,7 +1,7 @@
 """
 Client model - Pharmacy customers.
 """
-from sqlalchemy import String, Boolean, DateTime, Text, ForeignKey, DECIMAL, UniqueConstraint, CheckConstraint
+from sqlalchemy import String, Boolean, DateTime, Text, ForeignKey, DECIMAL, UniqueConstraint, ColumnElement, DDL, Enum, Index, event, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
@@ -30,12 +30,12 @@ class Client(Base):
     id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid_module.uuid4)
 
     # Foreign Key to Pharmacy (multi-tenant)
-    pharmacy_id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), ForeignKey("pharmacies.id", ondelete="CASCADE"), nullable=False, index=True)
+    pharmacy_id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), ForeignKey("pharmacies.id", ondelete="CASCADE"), nullable=False)
 
     # Client Identification
     external_id: Mapped[str | None] = mapped_column(String(100), nullable=True)  # ID from external system
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
-    phone_normalized: Mapped[str] = mapped_column(String(20), nullable=False, index=True)  # Standardized format for matching
+    phone_normalized: Mapped[str] = mapped_column(String(20), nullable=False)  # Standardized format for matching
 
     # Personal Information
     first_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
@@ -60,26 +60,39 @@ class Client(Base):
     current_balance: Mapped[Decimal] = mapped_column(DECIMAL(12, 2), default=0, nullable=False)  # Negative = owes money
 
     # Status
-    status: Mapped[str] = mapped_column(String(20), default="active", nullable=False)  # active, inactive, blocked
+    status: Mapped[str] = mapped_column(Enum("active", "inactive", "blocked", name="client_status"), default="active", nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Extra data (flexible JSON storage)
-    tags: Mapped[List] = mapped_column(JSONB, default=[], nullable=False)
-    extra_metadata: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
+    tags: Mapped[list[str]] = mapped_column(JSONB, default=list, nullable=False)
+    extra_metadata: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Relationships
     pharmacy = relationship("Pharmacy", back_populates="clients")
-    transactions = relationship("Transaction", back_populates="client", cascade="all, delete-orphan")
+    transactions = relationship("Transaction", back_populates="client", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
 
     # Constraints
     __table_args__ = (
-        UniqueConstraint("pharmacy_id", "phone_normalized", name="uq_pharmacy_client_phone"),
-        CheckConstraint(status.in_(["active", "inactive", "blocked"]), name="chk_client_status"),
+        # Also covers the summary columns, so phone lookups of a client's
+        # balance are index-only scans
+        UniqueConstraint(
+            "pharmacy_id",
+            "phone_normalized",
+            name="uq_pharmacy_client_phone",
+            postgresql_include=["id", "status", "credit_limit", "current_balance"],
+        ),
+        # Partial indexes for the per-pharmacy live (not soft-deleted), active and debtor listings.
+        # Lookups by pharmacy_id alone or with phone_normalized use uq_pharmacy_client_phone.
+        Index("ix_clients_live_by_pharmacy", "pharmacy_id", postgresql_where=deleted_at.is_(None)),
+        Index("ix_clients_active_by_pharmacy", "pharmacy_id", postgresql_where=status == "active"),
+        Index("ix_clients_debt_by_pharmacy", "pharmacy_id", "current_balance", postgresql_where=current_balance < 0),
+        # Tag lookups use JSONB containment (tags @> '["tag"]')
+        Index("ix_clients_tags", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
     )
 
     def __repr__(self):
@@ -89,3 +102,51 @@ class Client(Base):
     def owes_money(self) -> bool:
         """Check if client has outstanding debt."""
         return self.current_balance < 0
+
+
+def _search_field(column):
+    """NULL-safe text of a searchable column."""
+    return func.coalesce(column, literal_column("''", String))
+
+
+# Lower-cased names, phone and email text used by client search. Literals are
+# inlined (not bound) so queries render exactly the indexed expression.
+client_search_text = func.lower(
+    _search_field(Client.full_name)
+    + literal_column("' '", String)
+    + _search_field(Client.first_name)
+    + literal_column("' '", String)
+    + _search_field(Client.last_name)
+    + literal_column("' '", String)
+    + _search_field(Client.phone)
+    + literal_column("' '", String)
+    + _search_field(Client.email)
+)
+
+
+def client_search_filter(query: str) -> ColumnElement[bool]:
+    """
+    Substring match of `query` on `client_search_text`.
+
+    LIKE wildcards in the query ("%", "_") and the escape character itself
+    are escaped, so they match literally.
+    """
+    escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return client_search_text.like(f"%{escaped}%", escape="\\")
+
+# Trigram index so substring search (LIKE '%q%') avoids sequential scans
+Client.__table__.append_constraint(
+    Index(
+        "ix_clients_search_trgm",
+        client_search_text.label("search_text"),
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+)
+
+# gin_trgm_ops is provided by the pg_trgm extension
+event.listen(
+    Client.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
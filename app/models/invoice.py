@@ -1,7 +1,7 @@
 """
 Invoice model - PDF invoice management and tracking.
 """
-from sqlalchemy import String, DateTime, Integer, Boolean, ForeignKey, Text
+from sqlalchemy import String, DateTime, Integer, Boolean, ForeignKey, Text, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
@@ -41,7 +41,7 @@ class Invoice(Base):
     pdf_size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Generation Details
-    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     template_used: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     # Delivery Tracking
@@ -50,10 +50,10 @@ class Invoice(Base):
     viewed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Extra metadata (flexible JSON storage)
-    extra_metadata: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
+    extra_metadata: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
 
     # Relationships
     transaction = relationship("Transaction", back_populates="invoices")
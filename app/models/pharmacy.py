@@ -1,7 +1,7 @@
 """
 Pharmacy model - Multi-tenant master table.
 """
-from sqlalchemy import String, Boolean, DateTime, Text, CheckConstraint
+from sqlalchemy import String, Boolean, DateTime, Text, Enum, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
@@ -48,27 +48,23 @@ class Pharmacy(Base):
     timezone: Mapped[str] = mapped_column(String(50), default="America/Argentina/Buenos_Aires")
 
     # Status
-    status: Mapped[str] = mapped_column(String(20), default="active", nullable=False)  # active, suspended, inactive
+    status: Mapped[str] = mapped_column(Enum("active", "suspended", "inactive", name="pharmacy_status"), default="active", nullable=False)
     subscription_plan: Mapped[str | None] = mapped_column(String(50), nullable=True)  # free, basic, premium
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Settings (flexible JSON storage)
-    settings: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
-
-    # Relationships
-    access_tokens = relationship("AccessToken", back_populates="pharmacy", cascade="all, delete-orphan")
-    clients = relationship("Client", back_populates="pharmacy", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="pharmacy", cascade="all, delete-orphan")
-    audit_logs = relationship("AuditLog", back_populates="pharmacy", cascade="all, delete-orphan")
-
-    # Constraints
-    __table_args__ = (
-        CheckConstraint(status.in_(["active", "suspended", "inactive"]), name="chk_pharmacy_status"),
-    )
+    settings: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
+
+    # Relationships. Collections are never lazy loaded: load them explicitly
+    # (selectinload) or query the child table. Deletes cascade in the database.
+    access_tokens = relationship("AccessToken", back_populates="pharmacy", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    clients = relationship("Client", back_populates="pharmacy", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    transactions = relationship("Transaction", back_populates="pharmacy", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    audit_logs = relationship("AuditLog", back_populates="pharmacy", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
 
     def __repr__(self):
         return f"<Pharmacy(id={self.id}, name='{self.name}', status='{self.status}')>"
@@ -0,0 +1,30 @@
+"""
+Pharmacy client counter model - Per-pharmacy client external ID sequence.
+"""
+from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID as UUID_Type
+
+from app.db.base import Base
+
+
+class PharmacyClientCounter(Base):
+    """
+    Next client external ID for each pharmacy.
+
+    Incremented with a single `UPDATE ... RETURNING` per new client, so
+    external IDs are handed out without aggregating over the clients table
+    and without two concurrent inserts receiving the same ID.
+    """
+
+    __tablename__: str = "pharmacy_client_counters"  # type: ignore[assignment]
+
+    # One row per pharmacy
+    pharmacy_id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), ForeignKey("pharmacies.id", ondelete="CASCADE"), primary_key=True)
+
+    # Next external ID to hand out
+    next_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<PharmacyClientCounter(pharmacy_id={self.pharmacy_id}, next_id={self.next_id})>"
@@ -2,14 +2,15 @@
 Transaction model - Billing, payments, invoices, credit/debit notes.
 """
 from decimal import Decimal
-from sqlalchemy import String, DateTime, Text, ForeignKey, DECIMAL, Date, CheckConstraint
+from typing import Any
+from sqlalchemy import String, DateTime, Text, ForeignKey, DECIMAL, Date, Integer, ColumnElement, Computed, Enum, Index, and_, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime, date
 from uuid import UUID as UUID_Type
-import uuid as uuid_module
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Transaction(Base):
@@ -27,15 +28,17 @@ class Transaction(Base):
     __tablename__: str = "transactions"  # type: ignore[assignment]
 
     # Primary Key
-    id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid_module.uuid4)
+    id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)  # Time-ordered: append-heavy table
 
     # Foreign Keys
-    pharmacy_id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), ForeignKey("pharmacies.id", ondelete="CASCADE"), nullable=False, index=True)
+    pharmacy_id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), ForeignKey("pharmacies.id", ondelete="CASCADE"), nullable=False)
     client_id: Mapped[UUID_Type] = mapped_column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="RESTRICT"), nullable=False, index=True)
 
     # Transaction Details
     transaction_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)  # Auto-generated
-    transaction_type: Mapped[str] = mapped_column(String(20), nullable=False)  # invoice, payment, credit_note, debit_note
+    transaction_type: Mapped[str] = mapped_column(
+        Enum("invoice", "payment", "credit_note", "debit_note", name="transaction_type"), nullable=False
+    )
 
     # Amounts
     amount: Mapped[Decimal] = mapped_column(DECIMAL(12, 2), nullable=False)
@@ -46,7 +49,9 @@ class Transaction(Base):
 
     # Payment Details
     payment_method: Mapped[str | None] = mapped_column(String(50), nullable=True)  # cash, transfer, mercadopago, credit_card
-    payment_status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)  # pending, completed, failed, cancelled, refunded
+    payment_status: Mapped[str] = mapped_column(
+        Enum("pending", "completed", "failed", "cancelled", "refunded", name="payment_status"), default="pending", nullable=False
+    )
 
     # Mercado Pago Integration
     mercadopago_payment_id: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
@@ -55,54 +60,75 @@ class Transaction(Base):
 
     # Description & Line Items
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    items: Mapped[List] = mapped_column(JSONB, default=[], nullable=False)  # [{"name": "...", "quantity": 1, "unit_price": 10.00, "total": 10.00}]
+    items: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, default=list, nullable=False)  # [{"name": "...", "quantity": 1, "unit_price": 10.00, "total": 10.00}]
+    line_count: Mapped[int] = mapped_column(Integer, Computed("jsonb_array_length(items)", persisted=True))  # Maintained by the database
 
     # Invoice Details
     invoice_pdf_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
     invoice_sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Dates
-    transaction_date: Mapped[date] = mapped_column(Date, default=date.today, nullable=False, index=True)
+    transaction_date: Mapped[date] = mapped_column(Date, default=date.today, nullable=False)
     due_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     paid_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     cancelled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     cancelled_by: Mapped[UUID_Type | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     # Extra metadata (flexible JSON storage)
-    extra_metadata: Mapped[dict] = mapped_column(JSONB, default={}, nullable=False)
+    extra_metadata: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
 
     # Relationships
     pharmacy = relationship("Pharmacy", back_populates="transactions")
     client = relationship("Client", back_populates="transactions")
-    invoices = relationship("Invoice", back_populates="transaction", cascade="all, delete-orphan")
+    invoices = relationship("Invoice", back_populates="transaction", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
 
     # Constraints
     __table_args__ = (
-        CheckConstraint(
-            transaction_type.in_(["invoice", "payment", "credit_note", "debit_note"]),
-            name="chk_transaction_type"
+        # Per-pharmacy listing, newest first; also serves pharmacy_id lookups
+        Index("ix_transactions_pharmacy_date", "pharmacy_id", transaction_date.desc()),
+        # Per-pharmacy open transactions, ordered by due date
+        Index(
+            "ix_transactions_pending_by_pharmacy",
+            "pharmacy_id",
+            due_date.asc().nullsfirst(),
+            postgresql_where=(payment_status == "pending") & cancelled_at.is_(None),
         ),
-        CheckConstraint(
-            payment_status.in_(["pending", "completed", "failed", "cancelled", "refunded"]),
-            name="chk_payment_status"
+        # Overdue listings (Transaction.is_overdue) per pharmacy
+        Index(
+            "ix_transactions_overdue_by_pharmacy",
+            "pharmacy_id",
+            "due_date",
+            postgresql_where=(payment_status != "completed") & due_date.is_not(None),
         ),
+        # Line item lookups use JSONB containment (items @> '[{"name": "..."}]')
+        Index("ix_transactions_items", "items", postgresql_using="gin", postgresql_ops={"items": "jsonb_path_ops"}),
     )
 
     def __repr__(self):
         return f"<Transaction(id={self.id}, number='{self.transaction_number}', type='{self.transaction_type}', total={self.total_amount})>"
 
-    @property
+    @hybrid_property
     def is_paid(self) -> bool:
         """Check if transaction has been paid."""
         return self.payment_status == "completed"
 
-    @property
+    @hybrid_property
     def is_overdue(self) -> bool:
         """Check if transaction is overdue."""
         if self.due_date is None or self.is_paid:
             return False
         return date.today() > self.due_date
+
+    @is_overdue.inplace.expression
+    @classmethod
+    def _is_overdue_expression(cls) -> ColumnElement[bool]:
+        """SQL form of `is_overdue`, evaluated with the database clock."""
+        return and_(
+            cls.due_date.is_not(None),
+            cls.payment_status != "completed",
+            cls.due_date < func.current_date(),
+        )
@@ -0,0 +1,33 @@
+"""Exception handlers mapping domain errors to HTTP responses."""
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.domain.exceptions import DuplicateEntityError, EntityNotFoundError, ValidationError
+
+
+async def duplicate_entity_handler(request: Request, exc: DuplicateEntityError) -> ORJSONResponse:
+    """Respond 400 when an entity with the same unique value already exists."""
+    return ORJSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
+async def validation_error_handler(request: Request, exc: ValidationError) -> ORJSONResponse:
+    """Respond 400 when domain validation fails."""
+    return ORJSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
+async def entity_not_found_handler(request: Request, exc: EntityNotFoundError) -> ORJSONResponse:
+    """Respond 404 when a requested entity does not exist."""
+    return ORJSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the domain exception handlers on an application.
+
+    Routes let domain errors propagate instead of catching them one by one;
+    any other exception reaches the error handler middleware, which does not
+    expose its message outside debug mode.
+    """
+    app.add_exception_handler(DuplicateEntityError, duplicate_entity_handler)
+    app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(EntityNotFoundError, entity_not_found_handler)
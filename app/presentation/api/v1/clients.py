@@ -1,15 +1,18 @@
 """Client API endpoints using Clean Architecture."""
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from decimal import Decimal
+from typing import TypeVar
 
 from app.application.dto import CreateClientDTO, ClientResponseDTO
-from app.infrastructure.dependencies.use_cases import CreateClientUseCaseDep, GetClientUseCaseDep
-from app.domain.exceptions import DuplicateEntityError, EntityNotFoundError, ValidationError
+from app.infrastructure.dependencies.use_cases import CreateClientUseCaseDep, GetClientUseCaseDep, GetClientSummaryUseCaseDep
 
 
-router = APIRouter(prefix="/clients", tags=["clients"])
+# Responses are encoded with orjson even when the router is mounted on an
+# application that keeps the stdlib JSON response class
+router = APIRouter(prefix="/clients", tags=["clients"], default_response_class=ORJSONResponse)
 
 
 # Pydantic schemas for API validation
@@ -62,6 +65,36 @@ class ClientResponse(BaseModel):
         from_attributes = True
 
 
+class ClientSummaryResponse(BaseModel):
+    """Compact response schema for client (phone, status and balance)."""
+
+    id: UUID
+    phone: str
+    status: str
+    credit_limit: Decimal
+    current_balance: Decimal
+    available_credit: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+def _to_response(response_model: type[ResponseT], dto: object) -> ResponseT:
+    """
+    Build a response model from an application DTO without validating it.
+
+    DTOs are built by use cases from validated domain entities, so the
+    values already have the declared types; FastAPI still validates the
+    response once against `response_model`.
+    """
+    return response_model.model_construct(
+        **{field: getattr(dto, field) for field in response_model.model_fields}
+    )
+
+
 @router.post(
     "/",
     response_model=ClientResponse,
@@ -88,71 +121,31 @@ async def create_client(
 
     Raises:
         400: Validation error or duplicate phone number
-        500: Internal server error
     """
-    try:
-        # Convert API request to application DTO
-        command = CreateClientDTO(
-            pharmacy_id=request.pharmacy_id,
-            phone=request.phone,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            email=request.email,
-            tax_id=request.tax_id,
-            address=request.address,
-            city=request.city,
-            state=request.state,
-            postal_code=request.postal_code,
-            country=request.country,
-            credit_limit=request.credit_limit,
-            whatsapp_opted_in=request.whatsapp_opted_in,
-            tags=request.tags,
-            notes=request.notes,
-        )
-
-        # Execute use case
-        result = await use_case.execute(command)
-
-        # Convert DTO to API response
-        return ClientResponse(
-            id=result.id,
-            pharmacy_id=result.pharmacy_id,
-            phone=result.phone,
-            phone_normalized=result.phone_normalized,
-            first_name=result.first_name,
-            last_name=result.last_name,
-            full_name=result.full_name,
-            email=result.email,
-            tax_id=result.tax_id,
-            address=result.address,
-            city=result.city,
-            state=result.state,
-            postal_code=result.postal_code,
-            country=result.country,
-            credit_limit=result.credit_limit,
-            current_balance=result.current_balance,
-            available_credit=result.available_credit,
-            owes_money=result.owes_money,
-            status=result.status,
-            whatsapp_opted_in=result.whatsapp_opted_in,
-            tags=result.tags,
-        )
-
-    except DuplicateEntityError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}"
-        )
+    # Convert API request to application DTO
+    command = CreateClientDTO(
+        pharmacy_id=request.pharmacy_id,
+        phone=request.phone,
+        first_name=request.first_name,
+        last_name=request.last_name,
+        email=request.email,
+        tax_id=request.tax_id,
+        address=request.address,
+        city=request.city,
+        state=request.state,
+        postal_code=request.postal_code,
+        country=request.country,
+        credit_limit=request.credit_limit,
+        whatsapp_opted_in=request.whatsapp_opted_in,
+        tags=request.tags,
+        notes=request.notes,
+    )
+
+    # Execute use case
+    result = await use_case.execute(command)
+
+    # Convert DTO to API response
+    return _to_response(ClientResponse, result)
 
 
 @router.get(
@@ -177,44 +170,39 @@ async def get_client(
 
     Raises:
         404: Client not found
-        500: Internal server error
     """
-    try:
-        # Execute query use case
-        result = await use_case.execute(client_id)
-
-        # Convert DTO to API response
-        return ClientResponse(
-            id=result.id,
-            pharmacy_id=result.pharmacy_id,
-            phone=result.phone,
-            phone_normalized=result.phone_normalized,
-            first_name=result.first_name,
-            last_name=result.last_name,
-            full_name=result.full_name,
-            email=result.email,
-            tax_id=result.tax_id,
-            address=result.address,
-            city=result.city,
-            state=result.state,
-            postal_code=result.postal_code,
-            country=result.country,
-            credit_limit=result.credit_limit,
-            current_balance=result.current_balance,
-            available_credit=result.available_credit,
-            owes_money=result.owes_money,
-            status=result.status,
-            whatsapp_opted_in=result.whatsapp_opted_in,
-            tags=result.tags,
-        )
-
-    except EntityNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Internal server error: {str(e)}"
-        )
+    # Execute query use case
+    result = await use_case.execute(client_id)
+
+    # Convert DTO to API response
+    return _to_response(ClientResponse, result)
+
+
+@router.get(
+    "/summary/{client_id}",
+    response_model=ClientSummaryResponse,
+    summary="Get client summary by ID",
+    description="Retrieves only a client's phone, status and balance, without loading the full client"
+)
+async def get_client_summary(
+    client_id: UUID,
+    use_case: GetClientSummaryUseCaseDep
+) -> ClientSummaryResponse:
+    """
+    Get a client's phone, status and balance by ID.
+
+    Args:
+        client_id: Client unique identifier
+        use_case: Injected GetClientSummaryUseCase
+
+    Returns:
+        Client summary data
+
+    Raises:
+        404: Client not found
+    """
+    # Execute query use case
+    result = await use_case.execute(client_id)
+
+    # Convert DTO to API response
+    return _to_response(ClientSummaryResponse, result)
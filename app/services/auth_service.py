@@ -11,6 +11,7 @@ import uuid
 from app.models.access_token import AccessToken
 from app.models.pharmacy import Pharmacy
 from app.core.config import settings
+from app.middleware.auth_middleware import TokenAuthenticator
 
 
 class AuthService:
@@ -164,6 +165,7 @@ class AuthService:
         token.revoked_by = revoked_by
 
         await db.commit()
+        TokenAuthenticator.invalidate_token(token.token_hash)
         return True
 
     @staticmethod
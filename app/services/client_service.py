@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 import uuid
 
-from app.models.client import Client
+from app.models.client import Client, client_search_filter
 from app.utils.phone_utils import normalizar_numero_whatsapp as normalize_phone_number
 
 
@@ -218,7 +218,7 @@ class ClientService:
             db: Database session
             pharmacy_id: Pharmacy UUID
             status: Filter by status (active, inactive, blocked)
-            search: Search by name or phone
+            search: Search by name, phone or email
             limit: Max results to return
             offset: Number of results to skip
 
@@ -236,27 +236,30 @@ class ClientService:
             query = query.where(Client.status == status)
 
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                (Client.full_name.ilike(search_term)) |
-                (Client.first_name.ilike(search_term)) |
-                (Client.last_name.ilike(search_term)) |
-                (Client.phone.like(search_term)) |
-                (Client.phone_normalized.like(search_term))
-            )
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Apply pagination and ordering
-        query = query.order_by(Client.created_at.desc()).limit(limit).offset(offset)
-
-        result = await db.execute(query)
-        clients = list(result.scalars().all())
-
-        return clients, (total if total is not None else 0)
+            # Substring match on the trigram-indexed names, phone and email.
+            # phone_normalized is the phone without "+" and country prefix,
+            # so matching the phone also covers it.
+            query = query.where(client_search_filter(search))
+
+        # Page and total count in one round-trip: the window count is
+        # computed over all matching rows before LIMIT/OFFSET apply
+        page_query = (
+            query.add_columns(func.count().over().label("total"))
+            .order_by(Client.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await db.execute(page_query)).all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # An empty page past the end carries no count; only then count separately
+        if offset:
+            total = await db.scalar(select(func.count()).select_from(query.subquery()))
+            return [], (total if total is not None else 0)
+
+        return [], 0
 
     @staticmethod
     async def delete_client(
@@ -1,10 +1,11 @@
 import os
-import httpx
 import uuid
 import logging
 from typing import Any
 from datetime import datetime, timedelta
 
+from app.infrastructure.external.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 CHATTIGO_LOGIN_URL = os.getenv("CHATTIGO_LOGIN_URL")
@@ -29,20 +30,20 @@ async def get_chattigo_token() -> str | None:
         if not CHATTIGO_LOGIN_URL:
             raise ValueError("CHATTIGO_LOGIN_URL not configured")
         payload = {"username": CHATTIGO_USERNAME, "password": CHATTIGO_PASSWORD}
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.post(CHATTIGO_LOGIN_URL, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            token = data.get("access_token")
+        client = get_http_client()
+        response = await client.post(CHATTIGO_LOGIN_URL, json=payload, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+        token = data.get("access_token")
 
-            if not token:
-                raise ValueError("No se recibió token en la respuesta de Chattigo")
-            
-            # Guardar token con vencimiento de 50 minutos
-            _token_cache["access_token"] = token
-            _token_cache["expires_at"] = now + timedelta(minutes=50)
-            logger.info("Token de Chattigo obtenido correctamente")
-            return token
+        if not token:
+            raise ValueError("No se recibió token en la respuesta de Chattigo")
+        
+        # Guardar token con vencimiento de 50 minutos
+        _token_cache["access_token"] = token
+        _token_cache["expires_at"] = now + timedelta(minutes=50)
+        logger.info("Token de Chattigo obtenido correctamente")
+        return token
         
     except Exception as e:
         logger.error(f"❌ Error al obtener token de Chattigo: {e}")
@@ -77,11 +78,11 @@ async def enviar_mensaje_whatsapp(msisdn: str, mensaje: str, nombre_usuario: str
         if not CHATTIGO_MESSAGE_URL:
             logger.error("CHATTIGO_MESSAGE_URL not configured")
             return False
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.post(CHATTIGO_MESSAGE_URL, json=payload, headers=headers)
-            response.raise_for_status()
-            logger.info(f"✅ Mensaje enviado a {msisdn}: {mensaje}")
-            return True
+        client = get_http_client()
+        response = await client.post(CHATTIGO_MESSAGE_URL, json=payload, headers=headers, timeout=20)
+        response.raise_for_status()
+        logger.info(f"✅ Mensaje enviado a {msisdn}: {mensaje}")
+        return True
     except Exception as e:
         logger.error(f"❌ Error al enviar mensaje por Chattigo: {e}")
         return False
@@ -121,11 +122,11 @@ async def enviar_a_agente(msisdn: str, mensaje: str, nombre_usuario: str | None
     }
 
     try:
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.post(CHATTIGO_TRANSFER_URL, json=payload, headers=headers)
-            response.raise_for_status()
-            logger.info(f"✅ Transferencia enviada al agente para {msisdn}")
-            return True
+        client = get_http_client()
+        response = await client.post(CHATTIGO_TRANSFER_URL, json=payload, headers=headers, timeout=20)
+        response.raise_for_status()
+        logger.info(f"✅ Transferencia enviada al agente para {msisdn}")
+        return True
     except Exception as e:
         logger.error(f"Error al transferir conversación a agente: {e}")
         return False
@@ -31,30 +31,31 @@ def event_loop() -> Generator:
 async def async_engine():
     """Create a test database engine (for integration tests)."""
     from sqlalchemy.ext.asyncio import create_async_engine
-    from sqlalchemy.pool import NullPool
+    from sqlalchemy.pool import StaticPool
+
+    import app.models  # noqa: F401  (registers every table on Base.metadata)
+    from app.db.base import Base
 
     TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+    # One shared connection: each new connection to :memory: is an empty database
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
-        poolclass=NullPool,
+        poolclass=StaticPool,
     )
 
-    # Import Base only when needed
-    try:
-        from app.infrastructure.database.models.base import Base  # type: ignore
+    # Only the tables the repository tests use: the rest of the schema relies on
+    # PostgreSQL-only DDL (generated jsonb columns, NULLS FIRST index keys)
+    tables = [Base.metadata.tables[name] for name in ("clients", "pharmacy_client_counters")]
 
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
 
-        yield engine
+    yield engine
 
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-    except ImportError:
-        # Base models not yet implemented, skip database setup
-        yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=tables)
 
     await engine.dispose()
 
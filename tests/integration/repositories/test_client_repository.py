@@ -97,6 +97,62 @@ class TestClientRepositoryFindById:
         assert found is None
 
 
+@pytest.mark.asyncio
+class TestClientRepositoryFindSummaryById:
+    """Test find client summary by ID."""
+
+    async def test_find_summary_by_id_existing_client(self, async_session):
+        """Should find phone, status and balance by ID."""
+        repository = ClientRepository(async_session)
+
+        client = Client(
+            pharmacy_id=uuid4(),
+            phone=Phone.create("+54 9 11 1234 5678"),
+            first_name="Test",
+            balance=ClientBalance.create(
+                Money.create(Decimal("-200.00"), "ARS"),
+                Money.create(Decimal("1000.00"), "ARS")
+            )
+        )
+        created = await repository.create(client)
+
+        summary = await repository.find_summary_by_id(created.id)
+
+        assert summary is not None
+        assert summary.id == created.id
+        assert summary.phone.normalized == "+5491112345678"
+        assert summary.status == "active"
+        assert summary.balance.current_balance.amount == Decimal("-200.00")
+        assert summary.balance.available_credit.amount == Decimal("800.00")
+
+    async def test_find_summary_by_id_non_existent(self, async_session):
+        """Should return None for non-existent client."""
+        repository = ClientRepository(async_session)
+
+        summary = await repository.find_summary_by_id(uuid4())
+
+        assert summary is None
+
+    async def test_find_summary_by_phone_scoped_to_pharmacy(self, async_session):
+        """Should find the summary by phone only within the client's pharmacy."""
+        repository = ClientRepository(async_session)
+        pharmacy_id = uuid4()
+
+        client = Client(
+            pharmacy_id=pharmacy_id,
+            phone=Phone.create("+54 9 11 1234 5678"),
+            balance=ClientBalance.create(Money.zero("ARS"), Money.zero("ARS"))
+        )
+        created = await repository.create(client)
+
+        summary = await repository.find_summary_by_phone(Phone.create("+549 11 1234-5678"), pharmacy_id)
+        other = await repository.find_summary_by_phone(Phone.create("+54 9 11 1234 5678"), uuid4())
+
+        assert summary is not None
+        assert summary.id == created.id
+        assert other is None
+
+
 @pytest.mark.asyncio
 class TestClientRepositoryFindByPhone:
     """Test find client by phone number."""
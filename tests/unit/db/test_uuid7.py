@@ -0,0 +1,31 @@
+"""Unit tests for time-ordered UUID generation."""
+from app.db import base
+from app.db.base import uuid7
+
+
+class TestUuid7:
+    """Test UUIDv7 layout and ordering."""
+
+    def test_version_and_variant(self):
+        """Should set the version 7 and RFC variant bits."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_ids_within_one_millisecond_are_ordered(self, monkeypatch):
+        """Should order IDs generated in the same millisecond by the counter."""
+        monkeypatch.setattr(base.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+        ids = [uuid7() for _ in range(5000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_clock_going_backwards_keeps_order(self, monkeypatch):
+        """Should not sort before earlier IDs when the clock moves back."""
+        monkeypatch.setattr(base.time, "time_ns", lambda: 1_800_000_000_000_000_000)
+        first = uuid7()
+        monkeypatch.setattr(base.time, "time_ns", lambda: 1_799_999_999_000_000_000)
+
+        assert uuid7() > first
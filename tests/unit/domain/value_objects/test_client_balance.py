@@ -60,6 +60,20 @@ class TestClientBalanceCreation:
             )
 
 
+class TestClientBalanceFromTrusted:
+    """Test creating balances from stored, already validated values."""
+
+    def test_from_trusted_matches_create(self):
+        """Should build the same balance as create."""
+        current_balance = Money.create(Decimal("-200"), "ARS")
+        credit_limit = Money.create(Decimal("5000"), "ARS")
+
+        balance = ClientBalance.from_trusted(current_balance, credit_limit)
+
+        assert balance == ClientBalance.create(current_balance, credit_limit)
+        assert balance.available_credit.amount == Decimal("4800.00")
+
+
 class TestAvailableCredit:
     """Test available credit calculation."""
 
@@ -148,6 +148,45 @@ class TestMoneyArithmetic:
             money.divide(0)
 
 
+class TestMoneySum:
+    """Test bulk summation of money values."""
+
+    def test_sum_same_currency(self):
+        """Should sum all values into a single Money."""
+        items = [Money.create(Decimal("10.25"), "ARS") for _ in range(4)]
+
+        result = Money.sum(items, "ARS")
+
+        assert result.amount == Decimal("41.00")
+        assert result.currency == "ARS"
+
+    def test_sum_empty_returns_zero(self):
+        """Should return zero in the given currency for no items."""
+        result = Money.sum([], "USD")
+
+        assert result.is_zero()
+        assert result.currency == "USD"
+
+    def test_sum_different_currency_raises_error(self):
+        """Should raise error when an item has a different currency."""
+        items = [Money.create(Decimal("10"), "ARS"), Money.create(Decimal("5"), "USD")]
+
+        with pytest.raises(ValueError, match="Cannot add different currencies"):
+            Money.sum(items, "ARS")
+
+
+class TestMoneyFromTrusted:
+    """Test creating money from stored, already rounded amounts."""
+
+    def test_from_trusted_keeps_amount_and_currency(self):
+        """Should build the same value as create for a stored amount."""
+        money = Money.from_trusted(Decimal("1500.50"), "ARS")
+
+        assert money == Money.create(Decimal("1500.50"), "ARS")
+        assert money.amount == Decimal("1500.50")
+        assert money.currency == "ARS"
+
+
 class TestMoneyComparison:
     """Test money comparison operations."""
 
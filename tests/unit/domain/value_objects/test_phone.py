@@ -133,6 +133,20 @@ class TestPhoneFromNormalized:
             Phone.from_normalized("5491112345678")  # Missing +
 
 
+class TestPhoneFromTrusted:
+    """Test creating phones from stored, already validated numbers."""
+
+    def test_from_trusted_matches_from_normalized(self):
+        """Should build the same phone as from_normalized."""
+        normalized = "+5491112345678"
+
+        phone = Phone.from_trusted(normalized)
+
+        assert phone == Phone.from_normalized(normalized)
+        assert phone.value == normalized
+        assert phone.whatsapp_format == "5491112345678"
+
+
 class TestPhoneEdgeCases:
     """Test edge cases and special scenarios."""
 
@@ -141,6 +155,17 @@ class TestPhoneEdgeCases:
         with pytest.raises(ValidationError):
             Phone.create("   ")
 
+    def test_unicode_whitespace_separators_are_removed(self):
+        """Should accept non-breaking and other Unicode spaces as separators."""
+        assert Phone.create("+54\xa09\xa011\xa01234\xa05678").normalized == "+5491112345678"
+        assert Phone.create("11\u20071234-5678").normalized == "+541112345678"
+        assert Phone.create("+54 9 11 1234 5678\u2028").normalized == "+5491112345678"
+
+    def test_separators_only_raises_error(self):
+        """Should reject input made only of separators."""
+        with pytest.raises(ValueError, match="Invalid phone number format"):
+            Phone(value="+-() ", normalized="+54")
+
     def test_special_characters_in_middle_are_removed(self):
         """Should handle special characters in middle of number."""
         phone = Phone.create("+54.9.11.1234.5678")
@@ -0,0 +1,75 @@
+"""Unit tests for the shared configuration base."""
+import pytest  # type: ignore
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from app.infrastructure.config.base import BaseConfig, reset_environment
+
+
+class SampleConfig(BaseConfig):
+    """Minimal config used to exercise the shared environment source."""
+
+    model_config = SettingsConfigDict(env_prefix="SAMPLE_")
+
+    name: str = Field(default="default")
+    url: str = Field(default="none", alias="SAMPLE_URL_ALIAS")
+    retries: int = Field(default=1)
+    items: list[str] = Field(default=["a"])
+
+
+@pytest.fixture
+def environment(monkeypatch, tmp_path):
+    """Run each test in an empty directory with a fresh environment snapshot."""
+    monkeypatch.chdir(tmp_path)
+    reset_environment()
+    yield monkeypatch
+    reset_environment()
+
+
+class TestEnvironmentSource:
+    """Test resolution of config values from the shared environment snapshot."""
+
+    def test_defaults_without_environment(self, environment):
+        """Should fall back to field defaults."""
+        config = SampleConfig()
+
+        assert config.name == "default"
+        assert config.retries == 1
+
+    def test_reads_prefixed_variables(self, environment):
+        """Should read `{prefix}{field}` case-insensitively and coerce types."""
+        environment.setenv("sample_name", "custom")
+        environment.setenv("SAMPLE_RETRIES", "5")
+
+        config = SampleConfig()
+
+        assert config.name == "custom"
+        assert config.retries == 5
+
+    def test_reads_alias_without_prefix(self, environment):
+        """Should read aliased fields from the alias only."""
+        environment.setenv("SAMPLE_URL_ALIAS", "https://example.com")
+
+        assert SampleConfig().url == "https://example.com"
+
+    def test_decodes_json_for_complex_fields(self, environment):
+        """Should decode JSON values for list fields."""
+        environment.setenv("SAMPLE_ITEMS", '["x", "y"]')
+
+        assert SampleConfig().items == ["x", "y"]
+
+    def test_reads_dotenv_file(self, environment, tmp_path):
+        """Should read values from .env with process variables taking precedence."""
+        (tmp_path / ".env").write_text("SAMPLE_NAME=from-file\nSAMPLE_RETRIES=2\n")
+        environment.setenv("SAMPLE_RETRIES", "9")
+
+        config = SampleConfig()
+
+        assert config.name == "from-file"
+        assert config.retries == 9
+
+    def test_init_kwargs_take_precedence(self, environment):
+        """Should prefer explicit constructor values over the environment."""
+        environment.setenv("SAMPLE_NAME", "env")
+
+        assert SampleConfig(name="explicit").name == "explicit"
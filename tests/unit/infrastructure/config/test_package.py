@@ -0,0 +1,12 @@
+"""Unit tests for the lazily resolved configuration package exports."""
+import importlib
+
+
+def test_settings_is_the_instance_after_direct_submodule_import():
+    """Importing the submodule first must not shadow the exported instance."""
+    importlib.import_module("app.infrastructure.config.unified")
+
+    from app.infrastructure.config import Settings, get_settings, settings
+
+    assert isinstance(settings, Settings)
+    assert settings is get_settings()
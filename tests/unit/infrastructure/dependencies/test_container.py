@@ -0,0 +1,50 @@
+"""Unit tests for the dependency injection container."""
+from app.infrastructure.dependencies.container import DependencyContainer
+
+
+class IService:
+    """Interface used as a registration key."""
+
+
+class Service(IService):
+    """Implementation created by factories."""
+
+
+class TestRegistrationPrecedence:
+    """Test how singleton and factory registrations combine."""
+
+    def test_factory_creates_new_instances(self):
+        """Should call the factory on every resolve."""
+        container = DependencyContainer()
+        container.register_factory(IService, Service)
+
+        assert container.resolve(IService) is not container.resolve(IService)
+
+    def test_singleton_wins_over_later_factory(self):
+        """Should keep resolving the singleton after a factory is registered."""
+        container = DependencyContainer()
+        instance = Service()
+        container.register_singleton(IService, instance)
+        container.register_factory(IService, Service)
+        container.register(IService, Service)
+
+        assert container.resolve(IService) is instance
+        assert container.resolve_singleton(IService) is instance
+
+    def test_singleton_replaces_earlier_factory(self):
+        """Should resolve a singleton registered after a factory."""
+        container = DependencyContainer()
+        container.register_factory(IService, Service)
+        instance = Service()
+        container.register_singleton(IService, instance)
+
+        assert container.resolve(IService) is instance
+
+    def test_clear_drops_singleton_precedence(self):
+        """Should let factories register again after clear()."""
+        container = DependencyContainer()
+        container.register_singleton(IService, Service())
+        container.clear()
+        container.register_factory(IService, Service)
+
+        assert container.resolve(IService) is not container.resolve(IService)
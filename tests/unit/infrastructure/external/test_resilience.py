@@ -0,0 +1,172 @@
+"""Unit tests for circuit breaking, retries and bulkheads of external calls."""
+import asyncio
+
+import httpx
+import pytest  # type: ignore
+
+from app.infrastructure.external.resilience import (
+    Bulkhead,
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitOpenError,
+    send_with_retry,
+)
+
+
+def make_send(*outcomes):
+    """Build a request function returning (or raising) the given outcomes in order."""
+    calls = []
+    request = httpx.Request("POST", "https://example.test")
+
+    async def send():
+        outcome = outcomes[len(calls)]
+        calls.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, request=request)
+
+    return send, calls
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        """Should fail fast once consecutive failures reach the threshold."""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failures(self):
+        """Should only count consecutive failures."""
+        breaker = CircuitBreaker("test", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_after_timeout(self):
+        """Should let calls through again after the recovery timeout."""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_failure_reopens(self):
+        """Should open again when the first call after the timeout fails."""
+        breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=0)
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        breaker.recovery_timeout = 60
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestSendWithRetry:
+    """Test retrying of transient failures."""
+
+    async def test_retries_server_errors(self):
+        """Should retry 5xx replies of idempotent requests."""
+        send, calls = make_send(503, 502, 200)
+
+        response = await send_with_retry(CircuitBreaker("test"), send, base_delay=0)
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    async def test_returns_last_response_when_exhausted(self):
+        """Should hand the last failed reply back to the caller."""
+        send, calls = make_send(500, 500, 500)
+
+        response = await send_with_retry(CircuitBreaker("test"), send, base_delay=0)
+
+        assert response.status_code == 500
+        assert len(calls) == 3
+
+    async def test_does_not_retry_auth_failures(self):
+        """Should return 401/403 immediately."""
+        send, calls = make_send(401)
+
+        response = await send_with_retry(CircuitBreaker("test"), send, base_delay=0)
+
+        assert response.status_code == 401
+        assert len(calls) == 1
+
+    async def test_non_idempotent_not_retried_after_timeout(self):
+        """Should not repeat a request that may have been processed."""
+        send, calls = make_send(httpx.ReadTimeout("timeout"), 200)
+
+        with pytest.raises(httpx.ReadTimeout):
+            await send_with_retry(CircuitBreaker("test"), send, idempotent=False, base_delay=0)
+        assert len(calls) == 1
+
+    async def test_non_idempotent_retried_when_unsent(self):
+        """Should retry requests that never reached the upstream."""
+        send, calls = make_send(httpx.ConnectError("refused"), 429, 201)
+
+        response = await send_with_retry(CircuitBreaker("test"), send, idempotent=False, base_delay=0)
+
+        assert response.status_code == 201
+        assert len(calls) == 3
+
+    async def test_open_circuit_fails_fast(self):
+        """Should not send anything while the circuit is open."""
+        breaker = CircuitBreaker("test", failure_threshold=1)
+        breaker.record_failure()
+        send, calls = make_send(200)
+
+        with pytest.raises(CircuitOpenError):
+            await send_with_retry(breaker, send, base_delay=0)
+        assert calls == []
+
+
+class TestBulkhead:
+    """Test concurrency limiting and load shedding."""
+
+    async def test_limits_concurrent_calls(self):
+        """Should never run more than max_concurrent calls at once."""
+        bulkhead = Bulkhead("test", max_concurrent=2)
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with bulkhead:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+
+    async def test_sheds_when_queue_full(self):
+        """Should reject calls beyond the waiting limit immediately."""
+        bulkhead = Bulkhead("test", max_concurrent=1, max_waiting=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with bulkhead:
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadFullError):
+            async with bulkhead:
+                pass
+
+        release.set()
+        await asyncio.gather(holder, waiter)
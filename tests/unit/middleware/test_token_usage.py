@@ -0,0 +1,108 @@
+"""Unit tests for batched access token usage tracking."""
+import asyncio
+from uuid import uuid4
+
+import pytest  # type: ignore
+
+from app.middleware import token_usage
+from app.middleware.token_usage import TokenUsageTracker
+
+
+class FakeSession:
+    """Async session stand-in recording the parameter sets of each write."""
+
+    def __init__(self, writes, fail=False):
+        self.writes = writes
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def execute(self, statement, params):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.writes.append({p["b_token_id"]: p["b_uses"] for p in params})
+
+    async def commit(self):
+        return None
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Capture usage writes instead of opening database sessions."""
+    recorded = []
+    monkeypatch.setattr(token_usage, "async_session", lambda: FakeSession(recorded))
+    return recorded
+
+
+class TestTokenUsageTracker:
+    """Test recording, flushing and restarting the tracker."""
+
+    async def test_flush_writes_one_increment_per_token(self, writes):
+        """Should coalesce repeated uses of a token into a single count."""
+        tracker = TokenUsageTracker()
+        first, second = uuid4(), uuid4()
+        tracker.record(first)
+        tracker.record(first)
+        tracker.record(second)
+
+        await tracker.flush()
+        await tracker.flush()
+
+        assert writes == [{first: 2, second: 1}]
+
+    async def test_failed_write_keeps_counts(self, monkeypatch, writes):
+        """Should retry uses from a failed write on the next flush."""
+        tracker = TokenUsageTracker()
+        token_id = uuid4()
+        tracker.record(token_id)
+        monkeypatch.setattr(token_usage, "async_session", lambda: FakeSession(writes, fail=True))
+        await tracker.flush()
+
+        tracker.record(token_id)
+        monkeypatch.setattr(token_usage, "async_session", lambda: FakeSession(writes))
+        await tracker.flush()
+
+        assert writes == [{token_id: 2}]
+
+    async def test_max_pending_triggers_background_flush(self, writes):
+        """Should flush before the interval once enough uses are pending."""
+        tracker = TokenUsageTracker(interval=60, max_pending=2)
+        token_id = uuid4()
+        tracker.start()
+        tracker.record(token_id)
+        tracker.record(token_id)
+        await asyncio.sleep(0.01)
+
+        assert writes == [{token_id: 2}]
+        await tracker.stop()
+
+    async def test_stop_flushes_pending_usage(self, writes):
+        """Should write uses still pending when stopped."""
+        tracker = TokenUsageTracker(interval=60)
+        token_id = uuid4()
+        tracker.start()
+        tracker.record(token_id)
+
+        await tracker.stop()
+
+        assert writes == [{token_id: 1}]
+
+    def test_restart_on_a_new_event_loop(self, writes):
+        """Should start and stop again after a previous loop has closed."""
+        tracker = TokenUsageTracker(interval=0.01)
+        token_id = uuid4()
+
+        async def lifespan():
+            tracker.start()
+            tracker.record(token_id)
+            await asyncio.sleep(0.05)
+            await tracker.stop()
+
+        asyncio.run(lifespan())
+        asyncio.run(lifespan())
+
+        assert writes == [{token_id: 1}, {token_id: 1}]